@@ -1,7 +1,9 @@
-from uuid import UUID
+from dataclasses import dataclass
 from enum import Enum
 
-class ClaimStatusEnum(Enum):
+from ids import IdBytes
+
+class ClaimStatusEnum(str, Enum):
     draft = "draft"
     on_approval = "on_approval"
     approved = "approved"
@@ -11,14 +13,10 @@ class ClaimStatusEnum(Enum):
     partialy_paid = "partialy_paid"
 
 
+@dataclass(slots=True)
 class Claim:
-     def __init__(
-        self, id: UUID, number: int, payment_items: list, total_sum: int, status: ClaimStatusEnum
-    ) -> None:
-        self.id = id
-        self.number = number
-        self.payment_items = payment_items
-        self.status = status
-        self.total_sum = total_sum
-        
-    
\ No newline at end of file
+    id: IdBytes
+    number: int
+    payment_items: list
+    total_sum: int
+    status: ClaimStatusEnum
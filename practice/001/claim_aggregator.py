@@ -0,0 +1,41 @@
+from array import array
+
+import kernels
+from payment_item import PaymentItem, PaymentItemVat
+
+
+class ClaimAggregator:
+    """Суммы по предметам оплаты заявки.
+
+    Цены, кол-ва и ставки НДС хранятся в параллельных массивах (по столбцам),
+    поэтому итоги считаются одним проходом без обращения к атрибутам объектов.
+    """
+
+    __slots__ = ("prices", "quantities", "vat_pcts")
+
+    def __init__(self) -> None:
+        self.prices = array("q")
+        self.quantities = array("q")
+        self.vat_pcts = array("b")
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def add_item(self, price: int, quantity: int, vat: PaymentItemVat) -> int:
+        """Добавляет строку и возвращает её индекс."""
+        self.prices.append(price)
+        self.quantities.append(quantity)
+        self.vat_pcts.append(vat.value)
+        return len(self.prices) - 1
+
+    def add_payment_item(self, payment_item: PaymentItem) -> int:
+        return self.add_item(payment_item.price, payment_item.quantity, payment_item.vat)
+
+    def total_sum(self) -> int:
+        return kernels.sum_totals(self.prices, self.quantities)
+
+    def sum_vat(self) -> float:
+        return kernels.sum_vat(self.prices, self.quantities, self.vat_pcts)
+
+    def sum_without_vat(self) -> float:
+        return self.total_sum() - self.sum_vat()
@@ -0,0 +1,22 @@
+import os
+from uuid import UUID
+
+type IdBytes = bytes  # UUID4 в виде 16 байт, без объекта uuid.UUID
+
+ID_SIZE = 16
+
+
+def gen_ids(n: int) -> list[IdBytes]:
+    """Генерирует `n` идентификаторов UUID4 одним чтением из os.urandom."""
+    raw = bytearray(os.urandom(ID_SIZE * n))
+    ids = []
+    for start in range(0, ID_SIZE * n, ID_SIZE):
+        raw[start + 6] = (raw[start + 6] & 0x0F) | 0x40  # версия 4
+        raw[start + 8] = (raw[start + 8] & 0x3F) | 0x80  # вариант RFC 4122
+        ids.append(bytes(raw[start:start + ID_SIZE]))
+    return ids
+
+
+def id_as_uuid(id_: IdBytes) -> UUID:
+    """Возвращает идентификатор в виде UUID (для вывода)."""
+    return UUID(bytes=id_)
@@ -0,0 +1,17 @@
+"""Числовые ядра для подсчета сумм по столбцам предметов оплаты."""
+
+
+def sum_totals(prices, quantities):
+    s = 0
+    for i in range(len(prices)):
+        s += prices[i] * quantities[i]
+    return s
+
+
+def sum_vat(prices, quantities, vat_pcts):
+    # Сумма и НДС считаются в одном цикле, без промежуточного массива сумм
+    s = 0.0
+    for i in range(len(prices)):
+        t = prices[i] * quantities[i]
+        s += t * vat_pcts[i] / (100 + vat_pcts[i])
+    return s
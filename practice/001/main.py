@@ -1,74 +1,71 @@
+from dataclasses import replace
 from claim import Claim
-import uuid 
 from claim import ClaimStatusEnum
-from payment_item import PaymentItem
+from payment_item import PaymentItem, PaymentItemVat
 from payment_position import PaymentPosition, PaymentPositionStatusEnum
 from payment_registry import PaymentRegistry, PaymentRegistryStatusEnum
 from payment_order import PaymentOrder, PaymentOrderStatusEnum
+from ids import ID_SIZE, gen_ids
+from transitions import advance
+
+# Шаблоны новых объектов: при создании подменяются только отличающиеся поля
+_CLAIM_TEMPLATE = Claim(
+    id=bytes(ID_SIZE), number=0, payment_items=[], total_sum=0, status=ClaimStatusEnum.draft
+)
+_PAYMENT_POSITION_TEMPLATE = PaymentPosition(
+    id=bytes(ID_SIZE), number=0, total_sum=0, status=PaymentPositionStatusEnum.draft
+)
 
 #тут надо писать какую-то логику (например создание заявки с его атрибутивным составом)
 def main() -> None:
-    claim1 = Claim(
-        id=uuid.uuid4(), number=1, payment_items=[], total_sum=0, status=ClaimStatusEnum.draft
-    )
+    ids = iter(gen_ids(10))  # все идентификаторы сценария генерируются одним вызовом
+    claim1 = replace(_CLAIM_TEMPLATE, id=next(ids), number=1, payment_items=[])
     claim1.total_sum = 10
     
     payment_item1 = PaymentItem(
-        id=uuid.uuid4(), payment_positions=[], total_sum=0
+        id=next(ids), payment_positions=[], price=10, quantity=1, vat=PaymentItemVat.ten
     )
-    payment_item1.total_sum = 10
     payment_item2 = PaymentItem(
-        id=uuid.uuid4(), payment_positions=[], total_sum=0
+        id=next(ids), payment_positions=[], price=20, quantity=1, vat=PaymentItemVat.ten
     )
-    payment_item2.total_sum = 20
 
     claim1.payment_items = [payment_item1, payment_item2]
 
-    claim1.status = ClaimStatusEnum.on_approval
+    advance(claim1, ClaimStatusEnum.on_approval)
 
-    payment_position1 = PaymentPosition(
-        id=uuid.uuid4(), number=1, total_sum=10, status=PaymentPositionStatusEnum.draft
-    )
+    payment_position1 = replace(_PAYMENT_POSITION_TEMPLATE, id=next(ids), number=1, total_sum=10)
 
     payment_item1.payment_positions = [payment_position1]
 
-    payment_position1 = PaymentPosition(
-        id=uuid.uuid4(), number=2, total_sum=20, status=PaymentPositionStatusEnum.draft
-    )
+    payment_position1 = replace(_PAYMENT_POSITION_TEMPLATE, id=next(ids), number=2, total_sum=20)
 
     payment_item2.payment_positions = [payment_position1]
 
-    claim1.status = ClaimStatusEnum.approved
-    payment_position1.status = PaymentPositionStatusEnum.in_registry
+    advance(claim1, ClaimStatusEnum.approved)
+    advance(payment_position1, PaymentPositionStatusEnum.in_registry)
 
     payment_registry1 = PaymentRegistry(
-        id=uuid.uuid4(), payment_positions=[payment_position1], status=PaymentRegistryStatusEnum.on_approval
+        id=next(ids), payment_positions=[payment_position1], status=PaymentRegistryStatusEnum.on_approval
     )
-    payment_registry1.status = PaymentRegistryStatusEnum.approved
+    advance(payment_registry1, PaymentRegistryStatusEnum.approved)
 
     payment_order1 = PaymentOrder(
-        id=uuid.uuid4(), payment_registry=[payment_registry1], status=PaymentOrderStatusEnum.create, total_sum=20
+        id=next(ids), payment_registry=[payment_registry1], status=PaymentOrderStatusEnum.create, total_sum=20
     )
-    payment_order1.status = PaymentOrderStatusEnum.pending
+    advance(payment_order1, PaymentOrderStatusEnum.pending, PaymentOrderStatusEnum.payed)
+    advance(payment_registry1, PaymentRegistryStatusEnum.payed)
+    advance(payment_position1, PaymentPositionStatusEnum.payed)
+    advance(claim1, ClaimStatusEnum.partialy_paid)
 
-    payment_order1.status = PaymentOrderStatusEnum.payed
-    payment_registry1.status = PaymentRegistryStatusEnum.payed
-    payment_position1.status = PaymentPositionStatusEnum.payed
-    claim1.status = ClaimStatusEnum.partialy_paid
-
-    claim2 = Claim(
-        id=uuid.uuid4(), number=2, payment_items=[], total_sum=0, status=ClaimStatusEnum.draft
-    )
+    claim2 = replace(_CLAIM_TEMPLATE, id=next(ids), number=2, payment_items=[])
     payment_item3 = PaymentItem(
-         id=uuid.uuid4(), payment_positions=[], total_sum=3
+         id=next(ids), payment_positions=[], price=3, quantity=1, vat=PaymentItemVat.ten
     )
     claim2.total_sum = 3
-    claim2.status = ClaimStatusEnum.on_approval
-    payment_position2 = PaymentPosition(
-         id=uuid.uuid4(), number=3, total_sum=3, status=PaymentPositionStatusEnum.draft
-    )
-    claim2.status = ClaimStatusEnum.rejected
-    payment_position2.status = PaymentPositionStatusEnum.rejected
+    advance(claim2, ClaimStatusEnum.on_approval)
+    payment_position2 = replace(_PAYMENT_POSITION_TEMPLATE, id=next(ids), number=3, total_sum=3)
+    advance(claim2, ClaimStatusEnum.rejected)
+    advance(payment_position2, PaymentPositionStatusEnum.rejected)
     print("done")
 
     
@@ -1,20 +1,26 @@
-import uuid
 from enum import Enum
 
+from ids import IdBytes, gen_ids
+
 class PaymentItemVat(Enum):
     five = 5
     ten = 10
     twenty = 20
 
 class PaymentItem:
+    __slots__ = ("id", "payment_positions", "_price", "_quantity", "_vat", "_total_sum", "_sum_vat")
+
     def __init__(
-        self, id: uuid.UUID, payment_positions: list, price: int, quantity: int, vat: PaymentItemVat
+        self, id: IdBytes, payment_positions: list, price: int, quantity: int, vat: PaymentItemVat
     ) -> None:
         self.id = id
         self.payment_positions = payment_positions
+        # суммы пересчитываются в сеттерах, поэтому сначала заполняем все исходные поля
+        self._price = 0
+        self._quantity = 0
+        self._vat = vat
         self.price = price
         self.quantity = quantity
-        self.vat = vat 
 
     @property
     def price(self):
@@ -25,6 +31,7 @@ class PaymentItem:
         if value < 0:
             raise ValueError("Цена не может быть отрицательной")
         self._price = value
+        self._recompute()
 
     @property
     def quantity(self):
@@ -35,25 +42,38 @@ class PaymentItem:
         if value < 0:
             raise ValueError("Кол-во не может быть отрицательным")
         self._quantity = value
+        self._recompute()
+
+    @property
+    def vat(self):
+        return self._vat
+
+    @vat.setter
+    def vat(self, value):
+        self._vat = value
+        self._recompute()
+
+    def _recompute(self):
+        """Пересчитывает суммы при изменении цены, кол-ва или НДС."""
+        vat_value = self._vat.value
+        self._total_sum = self._price * self._quantity
+        self._sum_vat = (self._total_sum * vat_value) / (100 + vat_value)
     
     @property
     def total_sum(self):
-        total_sum = self.price * self.quantity
-        return total_sum
+        return self._total_sum
 
     @property
     def sum_vat(self):
-        sum_vat = (self.total_sum * self.vat.value) / (100 + self.vat.value)
-        return sum_vat
+        return self._sum_vat
 
     @property
     def sum_without_vat(self):
-        sum_without_vat = self.total_sum - self.sum_vat
-        return sum_without_vat  
+        return self._total_sum - self._sum_vat
 
 def main():
     payment_item1 = PaymentItem(
-        id=uuid.uuid4(), payment_positions=[], price=0, quantity=0, vat=PaymentItemVat.ten
+        id=gen_ids(1)[0], payment_positions=[], price=0, quantity=0, vat=PaymentItemVat.ten
     )
     a = 1
     assert payment_item1.sum_vat == 0     
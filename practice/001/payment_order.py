@@ -1,17 +1,17 @@
-from uuid import UUID
+from dataclasses import dataclass
 from enum import Enum
 
-class PaymentOrderStatusEnum(Enum):
+from ids import IdBytes
+
+class PaymentOrderStatusEnum(str, Enum):
     create = "create"
     pending = "pending"
     payed = "payed"    
 
 
+@dataclass(slots=True)
 class PaymentOrder:
-     def __init__(
-        self, id: UUID, payment_registry:list,  status: PaymentOrderStatusEnum, total_sum: int
-    ) -> None:
-        self.id = id
-        self.payment_registry = payment_registry
-        self.status = status
-        self.total_sum = total_sum 
\ No newline at end of file
+    id: IdBytes
+    payment_registry: list
+    status: PaymentOrderStatusEnum
+    total_sum: int
@@ -1,20 +1,18 @@
-from uuid import UUID
+from dataclasses import dataclass
 from enum import Enum
 
-class PaymentPositionStatusEnum(Enum):
+from ids import IdBytes
+
+class PaymentPositionStatusEnum(str, Enum):
     draft = "draft"
     in_registry = "in_registry"
     on_payment = "on_payment"
     payed = "payed"
     rejected = "rejected"
 
+@dataclass(slots=True)
 class PaymentPosition:
-     def __init__(
-        self, id: UUID, number: int, total_sum: int, status: PaymentPositionStatusEnum
-    ) -> None:
-        self.id = id
-        self.number = number
-        self.status = status
-        self.total_sum = total_sum
-        
-    
\ No newline at end of file
+    id: IdBytes
+    number: int
+    total_sum: int
+    status: PaymentPositionStatusEnum
@@ -1,7 +1,9 @@
-from uuid import UUID
+from dataclasses import dataclass
 from enum import Enum
 
-class PaymentRegistryStatusEnum(Enum):
+from ids import IdBytes
+
+class PaymentRegistryStatusEnum(str, Enum):
     draft = "draft"
     on_approval = "on_approval"
     approved = "approved"
@@ -10,11 +12,8 @@ class PaymentRegistryStatusEnum(Enum):
     
 
 
+@dataclass(slots=True)
 class PaymentRegistry:
-     def __init__(
-        self, id: UUID, payment_positions:list,  status: PaymentRegistryStatusEnum
-    ) -> None:
-        self.id = id
-        self.payment_positions = payment_positions
-        self.status = status
-        
+    id: IdBytes
+    payment_positions: list
+    status: PaymentRegistryStatusEnum
@@ -0,0 +1,56 @@
+from claim import ClaimStatusEnum
+from payment_order import PaymentOrderStatusEnum
+from payment_position import PaymentPositionStatusEnum
+from payment_registry import PaymentRegistryStatusEnum
+
+# Допустимые переходы статусов: текущий статус -> множество статусов, в которые можно перейти.
+# Таблицы разделены по классам статусов: str-перечисления с одинаковым значением равны между собой.
+CLAIM_TRANSITIONS = {
+    ClaimStatusEnum.draft: {ClaimStatusEnum.on_approval},
+    ClaimStatusEnum.on_approval: {ClaimStatusEnum.approved, ClaimStatusEnum.rejected},
+    ClaimStatusEnum.approved: {ClaimStatusEnum.on_payment, ClaimStatusEnum.partialy_paid, ClaimStatusEnum.payed},
+    ClaimStatusEnum.on_payment: {ClaimStatusEnum.partialy_paid, ClaimStatusEnum.payed},
+    ClaimStatusEnum.partialy_paid: {ClaimStatusEnum.payed},
+    ClaimStatusEnum.payed: set(),
+    ClaimStatusEnum.rejected: set(),
+}
+
+PAYMENT_POSITION_TRANSITIONS = {
+    PaymentPositionStatusEnum.draft: {PaymentPositionStatusEnum.in_registry, PaymentPositionStatusEnum.rejected},
+    PaymentPositionStatusEnum.in_registry: {PaymentPositionStatusEnum.on_payment, PaymentPositionStatusEnum.payed},
+    PaymentPositionStatusEnum.on_payment: {PaymentPositionStatusEnum.payed},
+    PaymentPositionStatusEnum.payed: set(),
+    PaymentPositionStatusEnum.rejected: set(),
+}
+
+PAYMENT_REGISTRY_TRANSITIONS = {
+    PaymentRegistryStatusEnum.draft: {PaymentRegistryStatusEnum.on_approval},
+    PaymentRegistryStatusEnum.on_approval: {PaymentRegistryStatusEnum.approved},
+    PaymentRegistryStatusEnum.approved: {PaymentRegistryStatusEnum.on_payment, PaymentRegistryStatusEnum.payed},
+    PaymentRegistryStatusEnum.on_payment: {PaymentRegistryStatusEnum.payed},
+    PaymentRegistryStatusEnum.payed: set(),
+}
+
+PAYMENT_ORDER_TRANSITIONS = {
+    PaymentOrderStatusEnum.create: {PaymentOrderStatusEnum.pending},
+    PaymentOrderStatusEnum.pending: {PaymentOrderStatusEnum.payed},
+    PaymentOrderStatusEnum.payed: set(),
+}
+
+TRANSITIONS = {
+    ClaimStatusEnum: CLAIM_TRANSITIONS,
+    PaymentPositionStatusEnum: PAYMENT_POSITION_TRANSITIONS,
+    PaymentRegistryStatusEnum: PAYMENT_REGISTRY_TRANSITIONS,
+    PaymentOrderStatusEnum: PAYMENT_ORDER_TRANSITIONS,
+}
+
+
+def advance(obj, *targets) -> None:
+    """Последовательно переводит объект по статусам `targets`, проверяя допустимость каждого перехода."""
+    status = obj.status
+    transitions = TRANSITIONS[type(status)]
+    for target in targets:
+        if type(target) is not type(status) or target not in transitions[status]:
+            raise ValueError(f"Недопустимый переход статуса: {status.value} -> {target.value}")
+        status = target
+    obj.status = status
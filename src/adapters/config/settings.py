@@ -1,51 +1,145 @@
+import dataclasses
+import os
 import pathlib
-from typing import Annotated
-from urllib.parse import quote_plus
+from collections.abc import Mapping
+from typing import Literal, Self, TypeAlias, TypedDict, get_args
+from urllib.parse import quote
 
 from dotenv import load_dotenv
 from loguru import logger
-from pydantic import Field, RedisDsn
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from sqlalchemy import URL
 
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "off"})
 
-class DatabaseSettings(BaseSettings):
+
+def _read_env(environ: Mapping[str, str], prefix: str) -> dict[str, str]:
+    """Возвращает переменные окружения с префиксом `prefix` (без учета регистра), ключи - без префикса.
+
+    Значения не обрезаются: пробелы могут быть значимыми (например, в пароле).
+    """
+    return {key.lower().removeprefix(prefix): value for key, value in environ.items() if key.lower().startswith(prefix)}
+
+
+def _parse_int(env_name: str, value: str) -> int:
+    """Преобразует значение переменной окружения `env_name` в int."""
+    try:
+        return int(value.strip())
+    except ValueError:
+        msg = f"Переменная окружения {env_name.upper()} должна быть целым числом, получено: {value!r}"
+        raise ValueError(msg) from None
+
+
+def _parse_bool(env_name: str, value: str) -> bool:
+    """Преобразует значение переменной окружения `env_name` в bool, неизвестные значения - ошибка."""
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    msg = f"Переменная окружения {env_name.upper()} должна быть булевым значением, получено: {value!r}"
+    raise ValueError(msg)
+
+
+# Поля `DatabaseSettings`, которые читаются из окружения как строки и как целые числа
+_DatabaseStrField: TypeAlias = Literal["name", "username", "password", "host"]  # noqa: UP040
+_DatabaseIntField: TypeAlias = Literal[  # noqa: UP040
+    "port",
+    "pool_size",
+    "max_overflow",
+    "pool_timeout",
+    "pool_recycle",
+    "statement_cache_size",
+    "prepared_statement_cache_size",
+]
+_DATABASE_STR_FIELDS: tuple[_DatabaseStrField, ...] = get_args(_DatabaseStrField)
+_DATABASE_INT_FIELDS: tuple[_DatabaseIntField, ...] = get_args(_DatabaseIntField)
+
+
+class _DatabaseSettingsKwargs(TypedDict, total=False):
+    """Параметры `DatabaseSettings`, заданные в переменных окружения."""
+
+    name: str
+    username: str
+    password: str
+    host: str
+    port: int
+    echo: bool
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+    pool_recycle: int
+    statement_cache_size: int
+    prepared_statement_cache_size: int
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class DatabaseSettings:
     """Настройки подключения к базе данных."""
 
-    model_config = SettingsConfigDict(env_prefix="database_")
-    name: Annotated[str, Field(default="dev", description="Имя базы данных")]
-    username: Annotated[str, Field(default="dev", description="Имя пользователя для подключения к БД")]
-    password: Annotated[str, Field(default="dev", description="Пароль для подключения к БД")]
-    host: Annotated[str, Field(default="localhost", description="Хост базы данных")]
-    port: Annotated[int, Field(default=5432, description="Порт базы данных")]
-    echo: Annotated[bool, Field(default=False, description="Флаг для включения/выключения логирования SQL запросов SQLAlchemy")]
+    name: str = "dev"  # Имя базы данных
+    username: str = "dev"  # Имя пользователя для подключения к БД
+    password: str = "dev"  # Пароль для подключения к БД
+    host: str = "localhost"  # Хост базы данных
+    port: int = 5432  # Порт базы данных
+    echo: bool = False  # Флаг для включения/выключения логирования SQL запросов SQLAlchemy
+    pool_size: int = 20  # Кол-во постоянных соединений в пуле
+    max_overflow: int = 30  # Кол-во дополнительных соединений сверх pool_size при пиковой нагрузке
+    pool_timeout: int = 10  # Сколько секунд ждать свободное соединение из пула
+    pool_recycle: int = 1800  # Через сколько секунд соединение пересоздается
+    statement_cache_size: int = 1024  # Размер кэша подготовленных выражений asyncpg на соединение
+    prepared_statement_cache_size: int = 512  # Размер кэша подготовленных выражений SQLAlchemy на соединение
+    url: str = dataclasses.field(init=False, repr=False)  # URL для подключения, вычисляется один раз
 
-    @property
-    def url(self) -> str:
+    def __post_init__(self) -> None:
         """Генерирует URL для подключения к базе данных PostgreSQL с использованием asyncpg."""
-        db_url = URL.create(
-            drivername="postgresql+asyncpg",
-            database=self.name,
-            username=self.username,
-            password=quote_plus(self.password),  # Экранирование пароля для URL
-            host=self.host,
-            port=self.port,
-        ).render_as_string(hide_password=False)
-        url: str = db_url
-        return url
+        # Экранирование логина и пароля для URL (SQLAlchemy раскодирует их через unquote)
+        username = quote(self.username, safe="")
+        password = quote(self.password, safe="")
+        db_url = f"postgresql+asyncpg://{username}:{password}@{self.host}:{self.port}/{self.name}"
+        object.__setattr__(self, "url", db_url)
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> Self:
+        """Создает настройки из переменных окружения с префиксом `database_`."""
+        env = _read_env(os.environ if environ is None else environ, "database_")
+        kwargs: _DatabaseSettingsKwargs = {}
+        for field in _DATABASE_STR_FIELDS:
+            if field in env:
+                kwargs[field] = env[field]
+        for int_field in _DATABASE_INT_FIELDS:
+            if int_field in env:
+                kwargs[int_field] = _parse_int(f"database_{int_field}", env[int_field])
+        if "echo" in env:
+            kwargs["echo"] = _parse_bool("database_echo", env["echo"])
+        return cls(**kwargs)
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class RedisSettings:
+    """Настройки подключения к Redis.
+
+    URL валидируется при подключении (см. `setup_redis`), а не при импорте.
+    """
 
+    url: str = "redis://localhost:6379/0"  # URL для подключения к Redis
 
-class RedisSettings(BaseSettings):
-    """Настройки подключения к Redis."""
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> Self:
+        """Создает настройки из переменных окружения с префиксом `redis_`."""
+        env = _read_env(os.environ if environ is None else environ, "redis_")
+        return cls(url=env["url"].strip()) if "url" in env else cls()
 
-    model_config = SettingsConfigDict(env_prefix="redis_")
-    url: RedisDsn = Field(default="redis://localhost:6379/0", description="URL для подключения к Redis")
 
+@dataclasses.dataclass(slots=True, frozen=True)
+class Settings:
+    db: DatabaseSettings  # Настройки базы данных
+    redis: RedisSettings  # Настройки Redis
 
-class Settings(BaseSettings):
-    model_config = SettingsConfigDict(extra="ignore", str_strip_whitespace=True)
-    db: DatabaseSettings = Field(default_factory=DatabaseSettings, description="Настройки базы данных")
-    redis: RedisSettings = Field(default_factory=RedisSettings, description="Настройки Redis")
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> Self:
+        """Создает настройки из переменных окружения."""
+        environ = os.environ if environ is None else environ
+        return cls(db=DatabaseSettings.from_env(environ), redis=RedisSettings.from_env(environ))
 
 
 # # Вычисляет путь к .env файлу из родительской директории
@@ -59,5 +153,5 @@ class Settings(BaseSettings):
 # else:
 #     logger.info("Не найден .env файл. Используются только переменные окружения")
 
-# Экземпляр настроек, загружаемых из переменных окружения и .env файла, если он есть.
-settings = Settings()
+# Экземпляр настроек, загружаемых из переменных окружения.
+settings = Settings.from_env()
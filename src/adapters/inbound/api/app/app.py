@@ -10,7 +10,7 @@ from adapters.inbound.api.app.exception_handlers import register_common_exceptio
 from adapters.inbound.api.app.integrations.initialize import initialize_integrations
 from adapters.inbound.api.app.integrations.teardown import teardown_integrations
 from adapters.inbound.api.app.middlewares.setup import setup_middlewares
-from adapters.inbound.api.app.router import api_router
+from adapters.inbound.api.app.router import build_api_router
 
 
 @asynccontextmanager
@@ -37,6 +37,6 @@ def create_app() -> FastAPI:
         default_response_class=ORJSONResponse,
     )
     setup_middlewares(app)
-    app.include_router(api_router)
+    app.include_router(build_api_router())
     register_common_exception_handlers(app)
     return app
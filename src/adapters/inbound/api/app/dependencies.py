@@ -1,12 +1,30 @@
+from collections.abc import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from starlette.requests import Request
 
 from adapters.outbound.redis.client import AsyncRedisClient
 from core.shared_kernel.units_of_work.postgres import UnitOfWork
 
 
-def get_uow_from_request(request: Request) -> UnitOfWork:
-    """Возвращает uow из запроса."""
-    return request.app.state.uow_class(request.app.state.db_session_factory)
+async def get_uow_from_request(request: Request) -> AsyncGenerator[UnitOfWork]:
+    """Возвращает uow из пула приложения.
+
+    После обработки запроса uow очищается и возвращается в пул, если его сессия закрыта.
+    """
+    pool = request.app.state.uow_pool
+    uow = pool.pop() if pool else request.app.state.uow_class(request.app.state.db_session_factory)
+    try:
+        yield uow
+    finally:
+        if uow.session is None:
+            uow.release()
+            pool.append(uow)
+
+
+def get_session_factory(request: Request) -> async_sessionmaker[AsyncSession]:
+    """Возвращает фабрику сессий - для запросов на чтение, которым не нужен uow."""
+    return request.app.state.db_session_factory
 
 
 def get_redis_client(request: Request) -> AsyncRedisClient:
@@ -1,52 +1,42 @@
 from generic.domain.exceptions import (
     DomainError,
-    EntityFieldError,
     ExternalServiceError,
     FieldErrorDetail,
-    NotFoundError,
-    PermissionAccessError,
 )
 from generic.utils.log_levels import LogLevel
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 from pydantic import ValidationError
 from starlette import status
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
+
+
+_LOG_FUNC_BY_LEVEL = {
+    LogLevel.DEBUG: logger.debug,
+    LogLevel.INFO: logger.info,
+    LogLevel.WARNING: logger.warning,
+    LogLevel.ERROR: logger.error,
+    LogLevel.FATAL: logger.critical,
+}
 
 
 def _log_domain_exception(exc: DomainError) -> None:
     """Логирование исключений домена."""
-    try:
-        method_name = exc.log_level.value.lower()
-        log_func = getattr(logger, method_name)
-    except AttributeError:
-        logger.exception("Wrong log_level in exc")
+    log_func = _LOG_FUNC_BY_LEVEL.get(exc.log_level)
+    if log_func is None:
+        logger.error("Wrong log_level in exc: {}", exc.log_level)
         log_func = logger.error
 
     log_func(exc.as_dict(include_tech_details=True))
 
 
-def _handle_not_found_error(request: Request, exc: NotFoundError) -> Response:  # noqa: ARG001
-    _log_domain_exception(exc)
-    return JSONResponse(exc.as_dict(), status_code=status.HTTP_404_NOT_FOUND)
-
-
-def _handle_entity_field_error(request: Request, exc: EntityFieldError) -> Response:  # noqa: ARG001
-    _log_domain_exception(exc)
-    return JSONResponse(exc.as_dict(), status_code=status.HTTP_400_BAD_REQUEST)
-
-
 def _handle_domain_error(request: Request, exc: DomainError) -> Response:  # noqa: ARG001
+    """Обработчик исключений домена, HTTP-код берется из `exc.http_status`."""
     _log_domain_exception(exc)
-    return JSONResponse(exc.as_dict(), status_code=status.HTTP_400_BAD_REQUEST)
-
-
-def _handle_permission_access_error(request: Request, exc: PermissionAccessError) -> Response:  # noqa: ARG001
-    """Обработчик ошибок доступа."""
-    _log_domain_exception(exc)
-    return JSONResponse(exc.as_dict(), status_code=status.HTTP_403_FORBIDDEN)
+    return ORJSONResponse(exc.as_dict(), status_code=exc.http_status)
 
 
 def _handle_external_service_error(request: Request, exc: ExternalServiceError) -> Response:  # noqa: ARG001
@@ -68,36 +58,63 @@ def _handle_external_service_error(request: Request, exc: ExternalServiceError)
     else:
         status_code = status.HTTP_400_BAD_REQUEST
 
-    return JSONResponse(exc.as_dict(), status_code=status_code)
+    return ORJSONResponse(exc.as_dict(), status_code=status_code)
 
 
 def handle_validation_error(request: Request, exc: RequestValidationError | ValidationError) -> Response:  # noqa: ARG001
     """Обработчик исключений валидации (Pydantic)."""
-    logger.info(repr(exc))
-    err = exc.errors()[0]
+    # repr ValidationError строится по всем ошибкам, поэтому вычисляем его только если INFO логируется
+    logger.opt(lazy=True).info("{}", lambda: repr(exc))
+    if isinstance(exc, ValidationError):
+        err = exc.errors(include_url=False, include_context=False, include_input=False)[0]
+    else:
+        err = exc.errors()[0]  # RequestValidationError хранит уже готовый список ошибок
 
     msg = f"Ошибка валидации: {err['msg']}"
     field = str(err["loc"][-1] or "")
     domain_error = DomainError(msg, field_errors=[FieldErrorDetail(field=field, message=msg)])
-    return JSONResponse(domain_error.as_dict(), status_code=status.HTTP_400_BAD_REQUEST)
+    return ORJSONResponse(domain_error.as_dict(), status_code=status.HTTP_400_BAD_REQUEST)
 
 
 def handle_unexpected_error(request: Request, exc: Exception) -> Response:  # noqa: ARG001
     """Обработчик всех остальных исключений."""
     logger.error(exc)
     err_content = {"message": "Произошла непредвиденная ошибка. Мы уже работаем над её устранением."}
-    return JSONResponse(err_content, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return ORJSONResponse(err_content, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 def register_common_exception_handlers(app: FastAPI) -> None:
     """Инициализация обработчиков исключений.
     Вызвать в shared_kernel.infra.fastapi.app.get_app
     """
-    app.add_exception_handler(NotFoundError, _handle_not_found_error)
-    app.add_exception_handler(EntityFieldError, _handle_entity_field_error)
     app.add_exception_handler(ExternalServiceError, _handle_external_service_error)
     app.add_exception_handler(DomainError, _handle_domain_error)
-    app.add_exception_handler(PermissionAccessError, _handle_permission_access_error)
     app.add_exception_handler(RequestValidationError, handle_validation_error)
     app.add_exception_handler(ValidationError, handle_validation_error)
     app.add_exception_handler(Exception, handle_unexpected_error)
+    _register_domain_error_subclasses(app)
+
+
+def _iter_subclasses(cls: type) -> list[type]:
+    """Возвращает всех наследников класса (рекурсивно)."""
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(_iter_subclasses(subclass))
+    return subclasses
+
+
+def _register_domain_error_subclasses(app: FastAPI) -> None:
+    """Явно регистрирует обработчики для всех наследников `DomainError`.
+
+    Starlette ищет обработчик, проходя по MRO исключения; после регистрации поиск сводится к одному
+    обращению к словарю. Для каждого наследника берется тот же обработчик, что нашелся бы по MRO.
+    Должна вызываться после импорта всех доменных исключений; для классов, объявленных позже,
+    продолжает работать обычный поиск по MRO.
+    """
+    registered = dict(app.exception_handlers)
+    for subclass in _iter_subclasses(DomainError):
+        if subclass in registered:
+            continue
+        handler = next(registered[cls] for cls in subclass.__mro__ if cls in registered)
+        app.exception_handlers[subclass] = handler
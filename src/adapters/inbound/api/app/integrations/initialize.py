@@ -1,10 +1,18 @@
+import asyncio
+from collections import deque
+
 from fastapi import FastAPI
 from loguru import logger
+from pydantic import RedisDsn, TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
+from adapters.config.settings import settings
 from adapters.outbound.database.utils import create_engine_and_session_factory
 from adapters.outbound.redis.client import AsyncRedisClient
 from core.shared_kernel.units_of_work.postgres import UnitOfWork
 
+UOW_POOL_SIZE = 256
+
 
 def setup_postgres(app: FastAPI) -> None:
     """Создает подключение к базе данных PostgreSQL.
@@ -19,19 +27,44 @@ def setup_postgres(app: FastAPI) -> None:
     logger.info("SQLAlchemy Engine и Session Factory созданы и сохранены в app.state")
 
 
+async def warm_up_postgres_pool(app: FastAPI) -> None:
+    """Заранее открывает `pool_size` соединений с БД.
+
+    Соединения удерживаются одновременно и сразу возвращаются в пул, поэтому первые запросы
+    не тратят время на установку соединения. Ошибки подключения не прерывают запуск.
+    """
+    engine: AsyncEngine = app.state.db_engine
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(settings.db.pool_size)),
+        return_exceptions=True,
+    )
+    connections = [result for result in results if isinstance(result, AsyncConnection)]
+    await asyncio.gather(*(connection.close() for connection in connections))
+    if len(connections) < len(results):
+        logger.warning("Пул соединений с БД прогрет частично: {} из {}", len(connections), len(results))
+    else:
+        logger.info("Пул соединений с БД прогрет: {} соединений", len(connections))
+
+
 def setup_uow(app: FastAPI) -> None:
-    """Записывает `UnitOfWork` в `app.state`."""
+    """Записывает `UnitOfWork` и пул переиспользуемых экземпляров в `app.state`."""
     app.state.uow_class = UnitOfWork
+    app.state.uow_pool = deque(maxlen=UOW_POOL_SIZE)
 
 
 def setup_redis(app: FastAPI) -> None:
-    """Создает подключение к Redis."""
-    app.state.redis_client = AsyncRedisClient()
+    """Создает подключение к Redis.
+
+    URL из настроек валидируется здесь, а не при импорте настроек.
+    """
+    redis_url = TypeAdapter(RedisDsn).validate_python(settings.redis.url)
+    app.state.redis_client = AsyncRedisClient(url=redis_url.encoded_string())
 
 
 async def initialize_integrations(app: FastAPI) -> None:
     """Инициализирует интеграции приложения."""
     setup_postgres(app)
+    await warm_up_postgres_pool(app)
     setup_uow(app)
     setup_redis(app)
     logger.info("Все интеграции успешно инициализированы")
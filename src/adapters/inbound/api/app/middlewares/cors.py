@@ -1,15 +1,30 @@
 from fastapi import FastAPI
 from loguru import logger
 from starlette.middleware.cors import CORSMiddleware
+from starlette.types import Receive, Scope, Send
+
+# Служебные пути (проверки состояния), для которых CORS не нужен
+CORS_EXCLUDED_PATH_PREFIXES = ("/health",)
+
+
+class InternalPathsSkippingCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware, который пропускает без обработки запросы к служебным путям."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(CORS_EXCLUDED_PATH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
 
 
 def setup_cors(app: FastAPI) -> None:
     """Настраивает и добавляет CORSMiddleware к приложению FastAPI.
 
     Разрешает запросы со всех источников, методов и заголовков.
+    Запросы к служебным путям (`CORS_EXCLUDED_PATH_PREFIXES`) обрабатываются без CORS.
     """
     app.add_middleware(
-        CORSMiddleware,
+        InternalPathsSkippingCORSMiddleware,
         allow_origins=["*"],  # Разрешенные источники (домены). "*" разрешает все
         allow_methods=["*"],  # Разрешенные HTTP методы (GET, POST, etc). "*" разрешает все
         allow_credentials=True,  # Разрешает передачу cookie в кросс-доменных запросах
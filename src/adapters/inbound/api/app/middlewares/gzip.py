@@ -0,0 +1,15 @@
+from fastapi import FastAPI
+from loguru import logger
+from starlette.middleware.gzip import GZipMiddleware
+
+# Ответы меньше этого размера (в байтах) не сжимаются: выигрыш меньше накладных расходов
+GZIP_MINIMUM_SIZE = 512
+
+
+def setup_gzip(app: FastAPI) -> None:
+    """Добавляет GZipMiddleware к приложению FastAPI.
+
+    Сжимает ответы от `GZIP_MINIMUM_SIZE` байт, если клиент передал `Accept-Encoding: gzip`.
+    """
+    app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+    logger.info("GZip Middleware успешно добавлена")
@@ -4,9 +4,11 @@ from fastapi import FastAPI
 from loguru import logger
 
 from adapters.inbound.api.app.middlewares.cors import setup_cors
+from adapters.inbound.api.app.middlewares.gzip import setup_gzip
 
 
 def setup_middlewares(app: FastAPI) -> None:
     """Агрегирующая функция для добавления всех необходимых Middleware."""
+    setup_gzip(app)
     setup_cors(app)
-    logger.info("CORS Middleware успешно добавлена")
+    logger.info("Middleware успешно добавлены")
@@ -1,7 +1,17 @@
 from fastapi import APIRouter
 
-from adapters.inbound.api.controllers.claim import router as claim_router
 
+def build_api_router() -> APIRouter:
+    """Собирает общий роутер API.
 
-api_router = APIRouter()
-api_router.include_router(claim_router.router)
+    Контроллеры импортируются здесь, а не на уровне модуля, чтобы их граф импортов
+    (модели, схемы, репозитории) загружался только при создании приложения.
+    Маршруты контроллеров уже содержат свои prefix и tags, поэтому собираем их как есть,
+    без include_router, который пересоздает каждый маршрут.
+    """
+    from adapters.inbound.api.controllers.claim import router as claim_router
+
+    routes = [
+        *claim_router.router.routes,
+    ]
+    return APIRouter(routes=routes)
@@ -1,21 +1,53 @@
 import datetime as dt
 
+from core.claims.domain.aggregates.claim.aggregate import Claim
+from core.claims.domain.aggregates.claim.entities.payment_item.entity import PaymentItem
 from core.claims.domain.aggregates.claim.entities.payment_item.types import PaymentItemId
 from core.claims.domain.aggregates.claim.types import ClaimId
-from generic.api.pydantic_models import CamelCasedAliasesModel
+from generic.api.pydantic_models import CamelCasedAliasesModel, DumpedDatetime
+from query.claims.handlers.get import ClaimDetailDTO, PaymentItemDTO
 
 
 class _PaymentItem(CamelCasedAliasesModel):
     id: PaymentItemId
-    created_at: dt.datetime | None
-    updated_at: dt.datetime | None
+    created_at: DumpedDatetime | None
+    updated_at: DumpedDatetime | None
 
 
 class ClaimDetailSchemaOut(CamelCasedAliasesModel):
+    """Схема ответа `Заявки`. Для GET, POST и PATCH собирается через `claim_detail_from_dto`."""
+
     id: ClaimId
     system_number: str
-    created_at: dt.datetime | None
-    updated_at: dt.datetime | None
+    created_at: DumpedDatetime | None
+    updated_at: DumpedDatetime | None
     is_deleted: bool
-    deleted_at: dt.datetime | None
+    deleted_at: DumpedDatetime | None
     payment_items: list[_PaymentItem]
+
+
+def _payment_item_order(item: PaymentItemDTO | PaymentItem) -> tuple[bool, dt.datetime | None, PaymentItemId]:
+    """Ключ сортировки, повторяющий ORDER BY created_at, id в PostgreSQL (NULL - в конце)."""
+    return item.created_at is None, item.created_at, item.id
+
+
+def claim_detail_from_dto(claim: ClaimDetailDTO | Claim) -> ClaimDetailSchemaOut:
+    """Собирает схему ответа из DTO запроса или агрегата `Заявка`.
+
+    Данные уже провалидированы (при чтении из БД или в домене), поэтому схема собирается
+    через `model_construct` без повторной валидации каждого поля и предмета оплаты.
+    Предметы оплаты упорядочиваются так же, как в запросе GET (created_at NULLS LAST, id):
+    одинаковые данные дают одинаковое тело ответа и ETag во всех эндпоинтах.
+    """
+    return ClaimDetailSchemaOut.model_construct(
+        id=claim.id,
+        system_number=claim.system_number,
+        created_at=claim.created_at,
+        updated_at=claim.updated_at,
+        is_deleted=claim.is_deleted,
+        deleted_at=claim.deleted_at,
+        payment_items=[
+            _PaymentItem.model_construct(id=item.id, created_at=item.created_at, updated_at=item.updated_at)
+            for item in sorted(claim.payment_items, key=_payment_item_order)
+        ],
+    )
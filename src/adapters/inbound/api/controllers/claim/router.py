@@ -1,50 +1,52 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Body, Path
+from fastapi import APIRouter, Depends, Body, Header, Path, Response
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from adapters.inbound.api.app.dependencies import get_uow_from_request
+from adapters.inbound.api.app.dependencies import get_session_factory, get_uow_from_request
 from adapters.inbound.api.controllers.claim.input.claim import ClaimCreateSchemaIn, ClaimUpdateSchemaIn
-from adapters.inbound.api.controllers.claim.output.get_claim import ClaimDetailSchemaOut
+from adapters.inbound.api.controllers.claim.output.get_claim import ClaimDetailSchemaOut, claim_detail_from_dto
 from core.claims.domain.aggregates.claim.types import ClaimId
 from core.shared_kernel.units_of_work.postgres import UnitOfWork
 from core.claims.application.commands.claim import create, update
+from generic.api.responses import PydanticJSONResponse, with_etag
 from query.claims.handlers import get
 
 
 router = APIRouter(prefix="/claim", tags=["claim"])
 
 
-@router.get(path="/{claim_id}", summary="Возвращает Заявку")
+@router.get(path="/{claim_id}", response_model=ClaimDetailSchemaOut, summary="Возвращает Заявку")
 async def get_claim_controller(
     claim_id: Annotated[ClaimId, Path()],
-    uow: Annotated[UnitOfWork, Depends(get_uow_from_request)],
-) -> ClaimDetailSchemaOut:
-    async with uow:
-        claim = await get.Handler(uow.session).execute(claim_id=claim_id)
-        return ClaimDetailSchemaOut.model_validate(claim)
+    session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)],
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    # Для одного SELECT не нужны репозитории и события UoW - достаточно сессии.
+    # Соединение возвращается в пул до сборки ответа
+    async with session_factory() as session:
+        claim = await get.Handler(session).execute(claim_id=claim_id)
+    return with_etag(PydanticJSONResponse(claim_detail_from_dto(claim)), if_none_match)
 
 
-@router.post(path="", summary="Создает Заявку")
+@router.post(path="", response_model=ClaimDetailSchemaOut, summary="Создает Заявку")
 async def create_claim_controller(
     body: Annotated[ClaimCreateSchemaIn, Body()],
     uow: Annotated[UnitOfWork, Depends(get_uow_from_request)]
-) -> ClaimDetailSchemaOut:
+) -> Response:
     payload = create.Payload(system_number=body.system_number)
+    # Команда возвращает сохраненный агрегат - повторное чтение из БД не нужно
     created_claim = await create.Command(uow=uow).execute(payload)
-    async with uow:
-        claim = await get.Handler(uow.session).execute(claim_id=created_claim.id)
-        return ClaimDetailSchemaOut.model_validate(claim)
+    return with_etag(PydanticJSONResponse(claim_detail_from_dto(created_claim)))
 
 
-@router.patch(path="/{claim_id}", summary="Обновляет Заявку")
+@router.patch(path="/{claim_id}", response_model=ClaimDetailSchemaOut, summary="Обновляет Заявку")
 async def update_claim_controller(
     claim_id: Annotated[ClaimId, Path()],
     body: Annotated[ClaimUpdateSchemaIn, Body()],
     uow: Annotated[UnitOfWork, Depends(get_uow_from_request)],
-) -> ClaimDetailSchemaOut:
+) -> Response:
     update_data = update.UpdateData(system_number=body.system_number)
     payload = update.Payload(claim_id=claim_id, update_data=update_data)
     updated_claim = await update.Command(uow=uow).execute(payload)
-    async with uow:
-        claim = await get.Handler(uow.session).execute(claim_id=updated_claim.id)
-        return ClaimDetailSchemaOut.model_validate(claim)
+    return with_etag(PydanticJSONResponse(claim_detail_from_dto(updated_claim)))
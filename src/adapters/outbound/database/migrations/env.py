@@ -1,4 +1,5 @@
 import asyncio
+import pathlib
 from logging.config import fileConfig
 
 import alembic_postgresql_enum  # noqa: F401
@@ -25,12 +26,16 @@ target_metadata = SaBase.metadata
 
 
 def generate_revision_id(context, revision, directives):
-    # Получаем список существующих миграций
+    # Номер берется из имен файлов миграций (`0001_<slug>_<дата>.py`) без разбора их содержимого
     script = ScriptDirectory.from_config(context.config)
-    revisions = list(script.walk_revisions("base", "heads"))
+    numbers = [
+        int(prefix)
+        for path in pathlib.Path(script.versions).glob("*.py")
+        if (prefix := path.name.partition("_")[0]).isdigit()
+    ]
 
     # Определяем следующий номер
-    next_number = len(revisions) + 1
+    next_number = max(numbers, default=0) + 1
 
     # Форматируем номер в строку с ведущими нулями (например, "001")
     new_rev_id = f"{next_number:04}"
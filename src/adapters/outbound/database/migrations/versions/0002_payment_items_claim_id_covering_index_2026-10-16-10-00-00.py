@@ -0,0 +1,32 @@
+"""payment items claim_id covering index
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_claim_payment_items_claim_id_covering',
+        'claim_payment_items',
+        ['claim_id'],
+        unique=False,
+        postgresql_include=['id', 'created_at', 'updated_at'],
+    )
+    op.drop_index(op.f('ix_claim_payment_items_claim_id'), table_name='claim_payment_items')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_claim_payment_items_claim_id'), 'claim_payment_items', ['claim_id'], unique=False)
+    op.drop_index('ix_claim_payment_items_claim_id_covering', table_name='claim_payment_items')
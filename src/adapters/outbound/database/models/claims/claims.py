@@ -21,5 +21,5 @@ class SaClaim(SaSoftDeleteMixin, SaCreatedUpdatedMixin, SaBase):
 
     # Entities
     payment_items: Mapped[list[SaPaymentItem]] = relationship(
-        back_populates="claim", cascade="all, delete-orphan"
+        back_populates="claim", cascade="all, delete-orphan", lazy="raise"  # загружать только явно (N+1)
     )
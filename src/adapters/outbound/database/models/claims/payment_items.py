@@ -1,6 +1,6 @@
 import uuid
 import typing
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects import postgresql
 from adapters.outbound.database.base import SaBase
@@ -18,9 +18,17 @@ class SaPaymentItem(SaSoftDeleteMixin, SaCreatedUpdatedMixin, SaBase):
     """Таблица `Предмет оплаты`."""
 
     __tablename__ = "claim_payment_items"
+    __table_args__ = (
+        # Покрывающий индекс: подгрузка предметов оплаты по claim_id читается только из индекса
+        Index(
+            "ix_claim_payment_items_claim_id_covering",
+            "claim_id",
+            postgresql_include=["id", "created_at", "updated_at"],
+        ),
+    )
 
     id: Mapped[PaymentItemId] = mapped_column(postgresql.UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     # Relationships
-    claim_id: Mapped[ClaimId] = mapped_column(ForeignKey("claim_claims.id"), index=True)
+    claim_id: Mapped[ClaimId] = mapped_column(ForeignKey("claim_claims.id"))
     claim: Mapped["SaClaim"] = relationship(back_populates="payment_items")
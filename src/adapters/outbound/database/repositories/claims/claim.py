@@ -1,4 +1,10 @@
+from typing import Any
+
+from sqlalchemy import delete
+from sqlalchemy.dialects import postgresql
+
 from adapters.outbound.database.models.claims.claims import SaClaim
+from adapters.outbound.database.models.claims.payment_items import SaPaymentItem
 from adapters.outbound.database.repositories.claims.mapper import ClaimMapper
 from core.claims.domain.aggregates.claim.aggregate import Claim
 from core.claims.domain.aggregates.claim.exceptions import ClaimNotFoundError
@@ -10,3 +16,28 @@ class ClaimRepository(SaRepository[Claim, SaClaim, ClaimMapper]):
     _model = SaClaim
     mapper = ClaimMapper(entity_cls=Claim, orm_model=SaClaim)
     not_found_exception = ClaimNotFoundError
+
+    async def upsert(self, obj: Claim, **kwargs: Any) -> None:
+        """Добавляет или изменяет `Заявку`.
+
+        Предметы оплаты пишутся не каскадом (по INSERT на строку), а одним
+        `INSERT ... ON CONFLICT DO UPDATE` на все строки; удаленные из агрегата - одним DELETE.
+        """
+        await super().upsert(obj, with_payment_items=False, **kwargs)
+        # Строка заявки должна быть в БД до записи предметов оплаты (FK claim_id)
+        await self._session.flush()
+
+        rows = self.mapper.payment_item_rows(obj)
+        await self._session.execute(
+            delete(SaPaymentItem).where(
+                SaPaymentItem.claim_id == obj.id,
+                SaPaymentItem.id.not_in([row["id"] for row in rows]),
+            ),
+        )
+        if rows:
+            stmt = postgresql.insert(SaPaymentItem)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[SaPaymentItem.id],
+                set_={"updated_at": stmt.excluded.updated_at},
+            )
+            await self._session.execute(stmt, rows)
@@ -27,21 +27,40 @@ class ClaimMapper(BaseMapper[Claim, SaClaim]):
             deleted_at=orm.deleted_at,
         )
 
-    def entity_to_orm(self, obj: Claim, **_kwargs: Any) -> SaClaim:
-        payment_items = [
-            SaPaymentItem(
-                id=obj.id,
-                created_at=payment_item.created_at,
-                updated_at=payment_item.updated_at,
-            )
-            for payment_item in obj.payment_items
-        ]
-        return SaClaim(
+    def entity_to_orm(self, obj: Claim, *, with_payment_items: bool = True, **_kwargs: Any) -> SaClaim:
+        """Конвертирует Claim -> SaClaim.
+
+        При `with_payment_items=False` коллекция `payment_items` не заполняется
+        (предметы оплаты сохраняются отдельно, см. `payment_item_rows`).
+        """
+        sa_claim = SaClaim(
             id=obj.id,
             system_number=obj.system_number,
-            payment_items=payment_items,
             created_at=obj.created_at,
             updated_at=obj.updated_at,
             is_deleted=obj.is_deleted,
             deleted_at=obj.deleted_at,
-        )
\ No newline at end of file
+        )
+        if with_payment_items:
+            sa_claim.payment_items = [
+                SaPaymentItem(
+                    id=payment_item.id,
+                    created_at=payment_item.created_at,
+                    updated_at=payment_item.updated_at,
+                )
+                for payment_item in obj.payment_items
+            ]
+        return sa_claim
+
+    @staticmethod
+    def payment_item_rows(obj: Claim) -> list[dict[str, Any]]:
+        """Возвращает строки таблицы `claim_payment_items` для пакетной записи."""
+        return [
+            {
+                "id": payment_item.id,
+                "claim_id": obj.id,
+                "created_at": payment_item.created_at,
+                "updated_at": payment_item.updated_at,
+            }
+            for payment_item in obj.payment_items
+        ]
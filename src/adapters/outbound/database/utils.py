@@ -12,9 +12,17 @@ def create_engine_and_session_factory() -> tuple[AsyncEngine, async_sessionmaker
     """Создает engine и session_factory."""
     engine = create_async_engine(
         settings.db.url,
-        pool_size=20,
+        pool_size=settings.db.pool_size,
+        max_overflow=settings.db.max_overflow,
+        pool_timeout=settings.db.pool_timeout,
+        pool_recycle=settings.db.pool_recycle,
         pool_pre_ping=True,
         pool_use_lifo=True,
+        connect_args={
+            "statement_cache_size": settings.db.statement_cache_size,
+            "prepared_statement_cache_size": settings.db.prepared_statement_cache_size,
+        },
+        insertmanyvalues_page_size=1000,  # Кол-во строк в одном пакетном INSERT ... VALUES
         echo=settings.db.echo,
     )
     async_session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
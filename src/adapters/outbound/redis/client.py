@@ -11,9 +11,9 @@ class AsyncRedisClient:
     Предоставляет упрощенный интерфейс для основных операций Redis.
     """
 
-    def __init__(self) -> None:
-        """Инициализирует асинхронный клиент Redis на основе URL из настроек."""
-        self.client = Redis.from_url(url=settings.redis.url.encoded_string())
+    def __init__(self, url: str | None = None) -> None:
+        """Инициализирует асинхронный клиент Redis на основе `url` или URL из настроек."""
+        self.client = Redis.from_url(url=url or settings.redis.url)
 
     async def set(
         self,
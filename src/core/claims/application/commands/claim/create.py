@@ -12,6 +12,8 @@ class Payload(CamelCasedAliasesModel):
 class Command:
     """Команда создания Заявки."""
 
+    __slots__ = ("uow",)
+
     def __init__(self, uow: UnitOfWork) -> None:
         self.uow = uow
 
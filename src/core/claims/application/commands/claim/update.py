@@ -16,6 +16,8 @@ class Payload(CamelCasedAliasesModel):
 class Command:
     """Команда обновления `Заявки`."""
 
+    __slots__ = ("uow",)
+
     def __init__(self, uow: UnitOfWork) -> None:
         self.uow = uow
 
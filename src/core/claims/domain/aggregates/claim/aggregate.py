@@ -8,11 +8,14 @@ from core.claims.domain.aggregates.claim.types import ClaimId
 from generic.domain.entity import BaseEntity
 from generic.domain.mixins.created_updated import CreatedUpdatedMixin
 from generic.domain.mixins.soft_delete import SoftDeleteMixin
+from generic.utils.time_utils import now
 
 
 class Claim(SoftDeleteMixin, CreatedUpdatedMixin, BaseEntity):
     """Корень агрегата `Заявка`."""
 
+    __slots__ = ("system_number", "payment_items", "created_at", "updated_at", "_is_deleted", "_deleted_at")
+
     def __init__(
         self: Self,
         id: ClaimId,
@@ -35,3 +38,4 @@ class Claim(SoftDeleteMixin, CreatedUpdatedMixin, BaseEntity):
 
     def update(self: Self, system_number: str) -> None:
         self.system_number = system_number
+        self.updated_at = now()
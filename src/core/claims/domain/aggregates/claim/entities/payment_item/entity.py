@@ -8,6 +8,8 @@ from generic.domain.mixins.created_updated import CreatedUpdatedMixin
 class PaymentItem(CreatedUpdatedMixin, BaseEntity):
     """Сущность `Предмет оплаты `."""
 
+    __slots__ = ("created_at", "updated_at")
+
     def __init__(
         self: Self, 
         id: PaymentItemId,
@@ -1,9 +1,17 @@
 import datetime
-from typing import Any
+from typing import Annotated, Any
 
-import humps
-from pydantic import BaseModel, ConfigDict, Field, field_serializer
-from pydantic_core.core_schema import FieldSerializationInfo
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
+
+from generic.utils.case_utils import camelize
+
+
+# datetime, который в json сериализуется через `isoformat()` (UTC как `+00:00`, а не `Z`).
+# Сериализатор привязывается к полю при построении схемы, без метода модели на каждый дамп
+DumpedDatetime = Annotated[
+    datetime.datetime,
+    PlainSerializer(datetime.datetime.isoformat, return_type=str, when_used="json-unless-none"),
+]
 
 
 class CamelCasedAliasesModel(BaseModel):
@@ -27,19 +35,7 @@ class CamelCasedAliasesModel(BaseModel):
         {'fullName': 'name', 'extraNumber': 123}
     """
 
-    model_config = ConfigDict(populate_by_name=True, alias_generator=humps.camelize, from_attributes=True)
-
-    @field_serializer(
-        "created_at",
-        "updated_at",
-        "deleted_at",
-        "archived_at",
-        when_used="json-unless-none",
-        check_fields=False,
-    )
-    def default_datetime_fields_serialize(self, value: datetime.datetime, _info: FieldSerializationInfo) -> str:
-        """Сериализация datetime.datetime для json."""
-        return value.isoformat()
+    model_config = ConfigDict(populate_by_name=True, alias_generator=camelize, from_attributes=True)
 
 
 class BaseErrorSchemaOut(CamelCasedAliasesModel):
@@ -0,0 +1,39 @@
+import hashlib
+from http import HTTPStatus
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+class PydanticJSONResponse(ORJSONResponse):
+    """JSON-ответ, который сериализует pydantic-модель напрямую в байты средствами pydantic-core.
+
+    В отличие от возврата модели из view функции, FastAPI не валидирует модель повторно
+    и не строит промежуточный dict. Ключи сериализуются по псевдонимам (camelCase).
+    Остальные значения сериализуются как в `ORJSONResponse`.
+    Пример:
+        @router.get(path="/{foo_id}", response_model=FooSchemaOut)
+        async def get_foo_controller(foo_id: UUID) -> PydanticJSONResponse:
+            return PydanticJSONResponse(FooSchemaOut(...))
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, by_alias=True)
+        return super().render(content)
+
+
+def with_etag(response: Response, if_none_match: str | None = None) -> Response:
+    """Проставляет ответу ETag - хэш его тела.
+
+    Если ETag совпал с одним из переданных в заголовке `If-None-Match`, возвращает 304 без тела.
+    ETag слабый (`W/`), т.к. тело может быть сжато GZipMiddleware.
+    """
+    etag = f'W/"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+    client_etags = {tag.strip() for tag in if_none_match.split(",")} if if_none_match else set()
+    if "*" in client_etags or etag in client_etags:
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
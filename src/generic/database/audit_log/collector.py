@@ -1,15 +1,16 @@
 """Коллектор для сбора данных audit log."""
 
+import sys
 import uuid
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from enum import Enum
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any, Protocol, TypedDict
 
-import humps
-
 from generic.database.audit_log.enums import EntityAuditLogTypeEnum
-from generic.domain.entity import BaseEntity
+from generic.domain.entity import BaseEntity, entity_attr_names
+from generic.utils.case_utils import decamelize
 
 
 # Protocols для типизации
@@ -28,6 +29,8 @@ class LoggedEntity(Protocol):
 class AuditLogConstants:
     """Константы для audit log."""
 
+    __slots__ = ()
+
     DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
     DATE_FORMAT = "%Y-%m-%d"
     LOGS_ATTR_PREFIX = "_logs_changed_attrs"
@@ -70,74 +73,176 @@ class AuditLogRootDict(TypedDict):
 # Type aliases
 AuditLogData = AuditLogRootDict  # Базовый тип + динамические ключи с EntityRecordDict
 EntitiesChanges = dict[str, EntityRecordDict]
+EntityKey = tuple[str, str | None]  # (имя сущности, ID сущности) - ключ обработанной сущности
 
+# Значения поля "type" записи audit log по типу действия (без обращения к Enum.value на каждую запись)
+_TYPE_STR: dict[EntityAuditLogTypeEnum, str] = {t: sys.intern(t.value) for t in EntityAuditLogTypeEnum}
 
-class AuditLogValueSerializer:
-    """Сериализатор значений для audit log."""
+# Имена сущностей для audit log по классу (decamelize считается один раз на класс)
+_ENTITY_NAME_CACHE: dict[type, str] = {}
 
-    @staticmethod
-    def serialize(value: Any) -> Any:  # noqa: C901,PLR0911,PLR0912
-        """Сериализует значение для сохранения в JSONB.
+# Пары (имя слота, имя для audit log без `_`) по классу сущности, без служебных логов изменений
+_ATTR_NAMES_CACHE: dict[type, tuple[tuple[str, str], ...]] = {}
 
-        Args:
-            value: значение для сериализации
+# Признак "коллекция сущностей BaseEntity" по (класс сущности, имя поля); тип элементов
+# коллекции у поля фиксирован, поэтому проверка первого элемента выполняется один раз
+_IS_ENTITY_COLLECTION_CACHE: dict[tuple[type, str], bool] = {}
 
-        Returns:
-            Сериализованное значение
-        """
-        if value is None:
-            return None
+_MISSING = object()
 
-        try:
-            # Базовые типы
-            if isinstance(value, (str, int, float, bool)):
-                return value
 
-            # Enum
-            if isinstance(value, Enum):
-                return value.value
+def _iter_entity_attrs(obj: BaseEntity) -> Iterator[tuple[str, Any]]:
+    """Возвращает пары (имя атрибута без `_`, значение) установленных атрибутов сущности.
 
-            # UUID
-            if isinstance(value, uuid.UUID):
-                return str(value)
+    Список слотов фильтруется один раз на класс. Атрибуты из `__dict__` (у сущностей без `__slots__`)
+    проверяются при каждом обходе.
+    """
+    cls = obj.__class__
+    attr_names = _ATTR_NAMES_CACHE.get(cls)
+    if attr_names is None:
+        attr_names = tuple(
+            (name, name.removeprefix("_"))
+            for name in entity_attr_names(cls)
+            if not name.startswith(AuditLogConstants.LOGS_ATTR_PREFIX)
+        )
+        _ATTR_NAMES_CACHE[cls] = attr_names
 
-            # Datetime и date
-            if isinstance(value, datetime):
-                return value.strftime(AuditLogConstants.DATETIME_FORMAT)
-            if isinstance(value, date):
-                return value.strftime(AuditLogConstants.DATE_FORMAT)
+    for attr_name, clean_attr_name in attr_names:
+        attr_value = getattr(obj, attr_name, _MISSING)
+        if attr_value is not _MISSING:
+            yield clean_attr_name, attr_value
 
-            # Decimal
-            if isinstance(value, Decimal):
-                return float(value)
+    if instance_dict := getattr(obj, "__dict__", None):
+        logs_prefix = AuditLogConstants.LOGS_ATTR_PREFIX
+        for attr_name, attr_value in instance_dict.items():
+            if not attr_name.startswith(logs_prefix):
+                yield attr_name.removeprefix("_"), attr_value
 
-            # Set - конвертируем в list
-            if isinstance(value, set):
-                return [AuditLogValueSerializer.serialize(v) for v in value]
 
-            # List и tuple
-            if isinstance(value, (list, tuple)):
-                return [AuditLogValueSerializer.serialize(v) for v in value]
+def _is_entity_collection(owner: type, field_name: str, collection: Iterable[Any]) -> bool:
+    """Проверяет, является ли непустая коллекция поля `field_name` коллекцией сущностей BaseEntity."""
+    key = (owner, field_name)
+    is_entity_collection = _IS_ENTITY_COLLECTION_CACHE.get(key)
+    if is_entity_collection is None:
+        is_entity_collection = isinstance(next(iter(collection), None), BaseEntity)
+        _IS_ENTITY_COLLECTION_CACHE[key] = is_entity_collection
+    return is_entity_collection
 
-            # Dict
-            if isinstance(value, dict):
-                return {k: AuditLogValueSerializer.serialize(v) for k, v in value.items()}
 
-            # Для остальных типов используем строковое представление
-            return str(value)
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _serialize_datetime(value: datetime) -> str:
+    # То же, что strftime(DATETIME_FORMAT), но без разбора строки формата.
+    # Первые 19 символов - "YYYY-MM-DD HH:MM:SS" без смещения часового пояса
+    return value.isoformat(sep=" ", timespec="seconds")[:19]
+
+
+def _serialize_date(value: date) -> str:
+    # То же, что strftime(DATE_FORMAT)
+    return value.isoformat()
+
+
+# Сериализаторы по точному типу значения: один поиск в dict вместо цепочки isinstance.
+# Подклассы (в т.ч. Enum) и коллекции обрабатываются в _serialize
+_SERIALIZERS_BY_TYPE: dict[type, Callable[[Any], Any]] = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    uuid.UUID: str,
+    datetime: _serialize_datetime,
+    date: _serialize_date,
+    Decimal: float,
+}
+
+
+# Типы, значения которых уже пригодны для JSONB и сохраняются в снимке как есть
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _serialize(value: Any) -> Any:  # noqa: C901,PLR0911,PLR0912
+    """Сериализует значение для сохранения в JSONB.
 
-        except Exception:  # noqa: BLE001
-            # Fallback на строковое представление при любых ошибках сериализации
+    Args:
+        value: значение для сериализации
+
+    Returns:
+        Сериализованное значение
+    """
+    if value is None:
+        return None
+
+    try:
+        if serializer := _SERIALIZERS_BY_TYPE.get(type(value)):
+            return serializer(value)
+
+        # Базовые типы
+        if isinstance(value, (str, int, float, bool)):
+            return value
+
+        # Enum
+        if isinstance(value, Enum):
+            return value.value
+
+        # UUID
+        if isinstance(value, uuid.UUID):
             return str(value)
 
+        # Datetime и date
+        if isinstance(value, datetime):
+            return _serialize_datetime(value)
+        if isinstance(value, date):
+            return _serialize_date(value)
+
+        # Decimal
+        if isinstance(value, Decimal):
+            return float(value)
+
+        # Set - конвертируем в list
+        if isinstance(value, set):
+            return [_serialize(v) for v in value]
+
+        # List и tuple
+        if isinstance(value, (list, tuple)):
+            return [_serialize(v) for v in value]
+
+        # Dict
+        if isinstance(value, dict):
+            return {k: _serialize(v) for k, v in value.items()}
+
+        # Для остальных типов используем строковое представление
+        return str(value)
+
+    except Exception:  # noqa: BLE001
+        # Fallback на строковое представление при любых ошибках сериализации
+        return str(value)
+
+
+class AuditLogValueSerializer:
+    """Сериализатор значений для audit log."""
+
+    __slots__ = ()
+
+    # Тело вынесено в функцию модуля: рекурсивные вызовы не ищут атрибут класса
+    serialize = staticmethod(_serialize)
+
 
 class NestedEntitiesCollector:
     """Помощник для сбора вложенных сущностей."""
 
+    __slots__ = ("_entities",)
+
     def __init__(self) -> None:
         """Инициализирует коллектор."""
-        self.entities_set: set[int] = set()
-        self.entities: list[BaseEntity] = []
+        # Сущности по id объекта: словарь сохраняет порядок добавления и проверяет дубли одним хэшированием
+        self._entities: dict[int, BaseEntity] = {}
+
+    @property
+    def entities(self) -> list[BaseEntity]:
+        """Собранные сущности в порядке добавления."""
+        return list(self._entities.values())
 
     def add_entity(self, entity: BaseEntity) -> None:
         """Добавляет сущность если её ещё нет.
@@ -145,9 +250,7 @@ class NestedEntitiesCollector:
         Args:
             entity: сущность для добавления
         """
-        if id(entity) not in self.entities_set:
-            self.entities.append(entity)
-            self.entities_set.add(id(entity))
+        self._entities.setdefault(id(entity), entity)
 
     def add_from_collection(self, collection: list[Any] | tuple[Any, ...] | set[Any]) -> None:
         """Добавляет сущности из коллекции.
@@ -163,12 +266,23 @@ class NestedEntitiesCollector:
 class AuditLogCollector:
     """Собирает данные для audit log из сущностей."""
 
-    def _build_audit_log_data(self, obj: BaseEntity, action_type: EntityAuditLogTypeEnum) -> dict[str, Any]:
+    __slots__ = ()
+
+    @staticmethod
+    def now_str() -> str:
+        """Возвращает текущее время (UTC) в формате `created_at` audit log."""
+        return _serialize_datetime(datetime.now(UTC))
+
+    def _build_audit_log_data(
+        self, obj: BaseEntity, action_type: EntityAuditLogTypeEnum, created_at: str | None = None
+    ) -> dict[str, Any]:
         """Базовый метод для создания audit log данных.
 
         Args:
             obj: сущность для обработки
             action_type: тип действия (CREATE/UPDATE/DELETE)
+            created_at: время записи (см. `now_str`); при пакетной обработке передается одно на все сущности.
+                Если не передано - текущее время
 
         Returns:
             Словарь с данными audit log
@@ -188,19 +302,19 @@ class AuditLogCollector:
 
         return {
             "root_entity": self._get_entity_name(obj),
-            "created_at": datetime.now(UTC).strftime(AuditLogConstants.DATETIME_FORMAT),
+            "created_at": created_at or self.now_str(),
             **entities_changes,
         }
 
-    def collect_update_data(self, obj: BaseEntity) -> dict[str, Any]:
+    def collect_update_data(self, obj: BaseEntity, created_at: str | None = None) -> dict[str, Any]:
         """Возвращает данные об изменениях сущности и всех вложенных сущностей для audit log.
 
         Формат возвращаемых данных:
         {
-            "root_entity": "act",
+            "root_entity": "act_entity",
             "created_at": "2025-10-01 15:10:01",
-            "act": {
-                "id": "...",
+            "act_entity_<id>": {
+                "id": "<id>",
                 "type": "update",
                 "changes": {
                     "field1": {"old": old_value, "new": new_value},
@@ -210,37 +324,40 @@ class AuditLogCollector:
 
         Args:
             obj: сущность с изменениями
+            created_at: время записи; если не передано - текущее время
 
         Returns:
             Словарь с данными об изменениях
         """
-        return self._build_audit_log_data(obj, EntityAuditLogTypeEnum.UPDATE)
+        return self._build_audit_log_data(obj, EntityAuditLogTypeEnum.UPDATE, created_at)
 
-    def collect_delete_data(self, obj: BaseEntity) -> dict[str, Any]:
+    def collect_delete_data(self, obj: BaseEntity, created_at: str | None = None) -> dict[str, Any]:
         """Возвращает данные о сущности для audit log при удалении.
 
         Сохраняет полное состояние сущности и всех вложенных сущностей перед удалением.
 
         Args:
             obj: сущность для удаления
+            created_at: время записи; если не передано - текущее время
 
         Returns:
             Словарь с данными сущности в новом формате
         """
-        return self._build_audit_log_data(obj, EntityAuditLogTypeEnum.DELETE)
+        return self._build_audit_log_data(obj, EntityAuditLogTypeEnum.DELETE, created_at)
 
-    def collect_create_data(self, obj: BaseEntity) -> dict[str, Any]:
+    def collect_create_data(self, obj: BaseEntity, created_at: str | None = None) -> dict[str, Any]:
         """Возвращает данные о сущности для audit log при создании.
 
         Сохраняет полное состояние созданной сущности и всех вложенных сущностей.
 
         Args:
             obj: созданная сущность
+            created_at: время записи; если не передано - текущее время
 
         Returns:
             Словарь с данными сущности в новом формате
         """
-        return self._build_audit_log_data(obj, EntityAuditLogTypeEnum.CREATE)
+        return self._build_audit_log_data(obj, EntityAuditLogTypeEnum.CREATE, created_at)
 
     def _get_entity_name(self, obj: BaseEntity | Any) -> str:
         """Возвращает имя сущности для использования в audit log.
@@ -254,9 +371,12 @@ class AuditLogCollector:
         if not isinstance(obj, BaseEntity):
             return AuditLogConstants.UNKNOWN_ENTITY_NAME
 
-        class_name = obj.__class__.__name__
-        snake_case_name = humps.decamelize(class_name)
-        return f"{snake_case_name}_entity"
+        cls = obj.__class__
+        entity_name = _ENTITY_NAME_CACHE.get(cls)
+        if entity_name is None:
+            entity_name = f"{decamelize(cls.__name__)}_entity"
+            _ENTITY_NAME_CACHE[cls] = entity_name
+        return entity_name
 
     def _get_entity_id(self, obj: BaseEntity) -> str | None:
         """Возвращает ID сущности в виде строки.
@@ -269,39 +389,19 @@ class AuditLogCollector:
         """
         return str(obj.id) if hasattr(obj, "id") else None
 
-    def _should_skip_attribute(self, attr_name: str) -> bool:
-        """Проверяет, нужно ли пропустить атрибут при обработке.
-
-        Args:
-            attr_name: имя атрибута
-
-        Returns:
-            True если атрибут нужно пропустить
-        """
-        return attr_name.startswith(AuditLogConstants.LOGS_ATTR_PREFIX)
-
-    def _generate_unique_key(
-        self,
-        entity_name: str,
-        entity_id: str | None,
-        entities_changes: EntitiesChanges,
-    ) -> str:
+    def _generate_unique_key(self, entity_name: str, entity_id: str | None) -> str:
         """Генерирует уникальный ключ для сущности в словаре изменений.
 
-        Если сущность с таким именем уже есть, добавляет ID для уникальности.
+        Ключ всегда содержит ID (если он есть), поэтому не зависит от порядка обхода сущностей.
 
         Args:
             entity_name: имя сущности
             entity_id: ID сущности
-            entities_changes: словарь изменений
 
         Returns:
             Уникальный ключ
         """
-        key = entity_name
-        if key in entities_changes and entity_id:
-            key = f"{entity_name}_{entity_id}"
-        return key
+        return f"{entity_name}_{entity_id}" if entity_id else entity_name
 
     def _add_entity_record(
         self,
@@ -320,80 +420,42 @@ class AuditLogCollector:
             action_type: тип действия (CREATE/UPDATE/DELETE)
             changes: словарь с изменениями или снимком
         """
-        key = self._generate_unique_key(entity_name, entity_id, entities_changes)
+        key = self._generate_unique_key(entity_name, entity_id)
         record: EntityRecordDict = {
             "id": entity_id,
-            "type": action_type.value,
+            "type": _TYPE_STR[action_type],
             "changes": changes,
         }
         entities_changes[key] = record
 
-    def _should_process_entity(self, obj: BaseEntity | Any, processed_ids: set[str] | None) -> bool:
+    def _should_process_entity(self, entity_key: EntityKey, processed_ids: set[EntityKey] | None) -> bool:
         """Проверяет, нужно ли обрабатывать сущность.
 
         Args:
-            obj: объект для проверки
-            processed_ids: множество уже обработанных ID
+            entity_key: ключ сущности (имя, ID)
+            processed_ids: множество ключей уже обработанных сущностей
 
         Returns:
             True если сущность нужно обработать
         """
-        if not isinstance(obj, BaseEntity):
-            return False
-
-        if processed_ids is None:
-            return True
-
-        entity_id = self._get_entity_id(obj)
-        entity_name = self._get_entity_name(obj)
-        entity_key = f"{entity_name}_{entity_id}"
-
-        return entity_key not in processed_ids
+        return processed_ids is None or entity_key not in processed_ids
 
-    def _update_processed_ids(
-        self, processed_ids: set[str] | None, entity_name: str, entity_id: str | None
-    ) -> set[str]:
-        """Обновляет множество обработанных ID.
+    def _update_processed_ids(self, processed_ids: set[EntityKey] | None, entity_key: EntityKey) -> set[EntityKey]:
+        """Обновляет множество обработанных сущностей.
 
         Args:
-            processed_ids: текущее множество ID
-            entity_name: имя сущности
-            entity_id: ID сущности
+            processed_ids: текущее множество ключей
+            entity_key: ключ сущности (имя, ID)
 
         Returns:
-            Обновлённое множество ID
+            Обновлённое множество ключей
         """
         if processed_ids is None:
             processed_ids = set()
 
-        entity_key = f"{entity_name}_{entity_id}"
         processed_ids.add(entity_key)
         return processed_ids
 
-    def _handle_entity_field_change(
-        self,
-        entity_changes: dict[str, FieldChangeDict | M2MChangeDict],
-        field_name: str,
-        old_value: Any,
-        new_value: BaseEntity,
-        nested_collector: NestedEntitiesCollector,
-    ) -> None:
-        """Обрабатывает изменение поля-сущности.
-
-        Args:
-            entity_changes: словарь изменений для накопления
-            field_name: имя поля
-            old_value: старое значение
-            new_value: новое значение (BaseEntity)
-            nested_collector: коллектор вложенных сущностей
-        """
-        # Добавляем изменение ID если есть реальное изменение
-        if self._has_entity_id_changed(old_value, new_value):
-            entity_changes[field_name] = self._create_id_change_record(old_value, new_value)
-
-        # Добавляем для рекурсивной обработки
-        nested_collector.add_entity(new_value)
-
     def _has_entity_id_changed(self, old_value: Any, new_value: BaseEntity) -> bool:
         """Проверяет, изменился ли ID сущности.
 
@@ -421,55 +483,14 @@ class AuditLogCollector:
         old_id = str(old_value.id) if isinstance(old_value, BaseEntity) else (str(old_value) if old_value else None)
         return {"old": old_id, "new": str(new_value.id)}
 
-    def _handle_collection_field_change(
-        self,
-        entity_changes: dict[str, FieldChangeDict | M2MChangeDict],
-        field_name: str,
-        old_value: Any,
-        new_value: list[Any] | tuple[Any, ...] | set[Any],
-        nested_collector: NestedEntitiesCollector,
-    ) -> None:
-        """Обрабатывает изменение поля-коллекции.
-
-        Args:
-            entity_changes: словарь изменений для накопления
-            field_name: имя поля
-            old_value: старое значение
-            new_value: новое значение (коллекция)
-            nested_collector: коллектор вложенных сущностей
-        """
-        m2m_changes = self._get_m2m_changes_summary(old_value, new_value)
-        if m2m_changes:
-            entity_changes[field_name] = m2m_changes
-
-        # Собираем вложенные сущности из коллекции
-        nested_collector.add_from_collection(new_value)
-
-    def _handle_simple_field_change(
-        self,
-        entity_changes: dict[str, FieldChangeDict | M2MChangeDict],
-        field_name: str,
-        old_value: Any,
-        new_value: Any,
-    ) -> None:
-        """Обрабатывает изменение простого поля.
-
-        Args:
-            entity_changes: словарь изменений для накопления
-            field_name: имя поля
-            old_value: старое значение
-            new_value: новое значение
-        """
-        change: FieldChangeDict = {
-            "old": AuditLogValueSerializer.serialize(old_value),
-            "new": AuditLogValueSerializer.serialize(new_value),
-        }
-        entity_changes[field_name] = change
-
     def _process_changed_fields(
         self, obj: BaseEntity
     ) -> tuple[dict[str, FieldChangeDict | M2MChangeDict], NestedEntitiesCollector]:
-        """Обрабатывает изменённые поля сущности.
+        """Обрабатывает изменённые поля сущности и собирает её вложенные сущности.
+
+        Изменения берутся из логов изменённых атрибутов. Вложенные сущности (и изменённые, и нет)
+        собираются одним проходом по текущим значениям атрибутов: новое значение из лога
+        совпадает с текущим, поэтому отдельно из логов их не собираем.
 
         Args:
             obj: сущность для обработки
@@ -478,37 +499,27 @@ class AuditLogCollector:
             Кортеж из словаря изменений и коллектора вложенных сущностей
         """
         entity_changes: dict[str, FieldChangeDict | M2MChangeDict] = {}
-        nested_collector = NestedEntitiesCollector()
-
+        owner = obj.__class__
         for field_name, log_data in obj.logs_changed_attrs_by_field.items():
             clean_field_name = field_name.removeprefix("_")
             old_value = log_data.old_value
             new_value = log_data.new_value
 
+            # Поле-сущность: изменение фиксируется, только если изменился ID
             if isinstance(new_value, BaseEntity):
-                self._handle_entity_field_change(
-                    entity_changes, clean_field_name, old_value, new_value, nested_collector
-                )
+                if self._has_entity_id_changed(old_value, new_value):
+                    entity_changes[clean_field_name] = self._create_id_change_record(old_value, new_value)
+            # Поле-коллекция: added/removed для сущностей или old/new для простых значений
             elif isinstance(new_value, (list, tuple, set)):
-                self._handle_collection_field_change(
-                    entity_changes, clean_field_name, old_value, new_value, nested_collector
-                )
+                m2m_changes = self._get_m2m_changes_summary(old_value, new_value, owner, clean_field_name)
+                if m2m_changes:
+                    entity_changes[clean_field_name] = m2m_changes
+            # Простое поле
             else:
-                self._handle_simple_field_change(entity_changes, clean_field_name, old_value, new_value)
-
-        return entity_changes, nested_collector
-
-    def _collect_additional_nested_entities(self, obj: BaseEntity, nested_collector: NestedEntitiesCollector) -> None:
-        """Собирает дополнительные вложенные сущности, которые не изменились.
-
-        Args:
-            obj: сущность для обработки
-            nested_collector: коллектор вложенных сущностей
-        """
-        for attr_name, attr_value in vars(obj).items():
-            if self._should_skip_attribute(attr_name):
-                continue
+                entity_changes[clean_field_name] = {"old": _serialize(old_value), "new": _serialize(new_value)}
 
+        nested_collector = NestedEntitiesCollector()
+        for _attr_name, attr_value in _iter_entity_attrs(obj):
             # Если это вложенная сущность
             if isinstance(attr_value, BaseEntity):
                 nested_collector.add_entity(attr_value)
@@ -516,57 +527,66 @@ class AuditLogCollector:
             elif isinstance(attr_value, (list, tuple, set)):
                 nested_collector.add_from_collection(attr_value)
 
-    def _process_nested_entities(
+        return entity_changes, nested_collector
+
+    def _collect_entity_changes_hierarchical(
         self,
-        nested_entities: list[BaseEntity],
+        obj: BaseEntity | Any,
         action_type: EntityAuditLogTypeEnum,
         entities_changes: EntitiesChanges,
-        processed_ids: set[str],
+        processed_ids: set[EntityKey] | None = None,
     ) -> None:
-        """Рекурсивно обрабатывает вложенные сущности.
+        """Собирает изменения сущности и вложенных сущностей в иерархической структуре.
+
+        Обход в глубину по явному стеку, без рекурсии: порядок сущностей тот же,
+        что при рекурсивном обходе, а глубина вложенности не ограничена стеком вызовов.
 
         Args:
-            nested_entities: список вложенных сущностей
-            action_type: тип действия
-            entities_changes: словарь изменений
-            processed_ids: множество обработанных ID
+            obj: сущность для сбора изменений
+            action_type: тип действия (CREATE/UPDATE/DELETE)
+            entities_changes: словарь для накопления изменений по сущностям
+            processed_ids: множество уже обработанных id сущностей (для предотвращения циклов)
         """
-        for nested_entity in nested_entities:
-            self._collect_entity_changes_hierarchical(
-                obj=nested_entity,
-                action_type=action_type,
-                entities_changes=entities_changes,
-                processed_ids=processed_ids,
-            )
+        if processed_ids is None:
+            processed_ids = set()
 
-    def _collect_entity_changes_hierarchical(
+        stack: list[BaseEntity | Any] = [obj]
+        while stack:
+            nested_entities = self._collect_entity_changes(stack.pop(), action_type, entities_changes, processed_ids)
+            # В обратном порядке, чтобы первая вложенная сущность обрабатывалась первой
+            stack.extend(reversed(nested_entities))
+
+    def _collect_entity_changes(
         self,
         obj: BaseEntity | Any,
         action_type: EntityAuditLogTypeEnum,
         entities_changes: EntitiesChanges,
-        processed_ids: set[str] | None = None,
-    ) -> None:
-        """Собирает изменения сущности и вложенных сущностей в иерархической структуре.
+        processed_ids: set[EntityKey],
+    ) -> list[BaseEntity]:
+        """Собирает изменения одной сущности.
 
         Args:
             obj: сущность для сбора изменений
             action_type: тип действия (CREATE/UPDATE/DELETE)
             entities_changes: словарь для накопления изменений по сущностям
             processed_ids: множество уже обработанных id сущностей (для предотвращения циклов)
+
+        Returns:
+            Вложенные сущности для дальнейшего обхода
         """
-        if not self._should_process_entity(obj, processed_ids):
-            return
+        if not isinstance(obj, BaseEntity):
+            return []
 
         entity_id = self._get_entity_id(obj)
         entity_name = self._get_entity_name(obj)
-        processed_ids = self._update_processed_ids(processed_ids, entity_name, entity_id)
+        entity_key = (entity_name, entity_id)
+        if not self._should_process_entity(entity_key, processed_ids):
+            return []
+        self._update_processed_ids(processed_ids, entity_key)
 
-        # Обрабатываем изменённые поля
+        # Обрабатываем изменённые поля и собираем вложенные сущности
         entity_changes, nested_collector = self._process_changed_fields(obj)
 
-        # Собираем дополнительные вложенные сущности
-        self._collect_additional_nested_entities(obj, nested_collector)
-
         # Добавляем запись о текущей сущности, если есть изменения
         if entity_changes:
             self._add_entity_record(
@@ -577,19 +597,19 @@ class AuditLogCollector:
                 changes=entity_changes,
             )
 
-        # Рекурсивно обрабатываем вложенные сущности
-        self._process_nested_entities(nested_collector.entities, action_type, entities_changes, processed_ids)
+        return nested_collector.entities
 
-    def _collect_entity_snapshot_hierarchical(  # noqa:C901,PLR0912
+    def _collect_entity_snapshot_hierarchical(
         self,
         obj: BaseEntity | Any,
         action_type: EntityAuditLogTypeEnum,
         entities_changes: EntitiesChanges,
-        processed_ids: set[str] | None = None,
+        processed_ids: set[EntityKey] | None = None,
     ) -> None:
         """Собирает снимок сущности и вложенных сущностей в иерархической структуре.
 
         Используется для CREATE и DELETE операций.
+        Обход в глубину по явному стеку, без рекурсии (порядок как при рекурсивном обходе).
 
         Args:
             obj: сущность для снимка
@@ -597,31 +617,50 @@ class AuditLogCollector:
             entities_changes: словарь для накопления данных по сущностям
             processed_ids: множество уже обработанных id сущностей
         """
-        if not isinstance(obj, BaseEntity):
-            return
-
         if processed_ids is None:
             processed_ids = set()
 
+        stack: list[BaseEntity | Any] = [obj]
+        while stack:
+            nested_entities = self._collect_entity_snapshot(stack.pop(), action_type, entities_changes, processed_ids)
+            # В обратном порядке, чтобы первая вложенная сущность обрабатывалась первой
+            stack.extend(reversed(nested_entities))
+
+    def _collect_entity_snapshot(  # noqa:C901
+        self,
+        obj: BaseEntity | Any,
+        action_type: EntityAuditLogTypeEnum,
+        entities_changes: EntitiesChanges,
+        processed_ids: set[EntityKey],
+    ) -> list[BaseEntity]:
+        """Собирает снимок одной сущности.
+
+        Args:
+            obj: сущность для снимка
+            action_type: тип действия (CREATE/DELETE)
+            entities_changes: словарь для накопления данных по сущностям
+            processed_ids: множество уже обработанных id сущностей
+
+        Returns:
+            Вложенные сущности для дальнейшего обхода
+        """
+        if not isinstance(obj, BaseEntity):
+            return []
+
         entity_id = self._get_entity_id(obj)
         entity_name = self._get_entity_name(obj)
 
         # Защита от циклических ссылок
-        entity_key = f"{entity_name}_{entity_id}"
+        entity_key = (entity_name, entity_id)
         if entity_key in processed_ids:
-            return
+            return []
         processed_ids.add(entity_key)
 
         # Собираем снимок полей текущей сущности
         entity_snapshot: dict[str, Any] = {}
         nested_entities: list[BaseEntity] = []
 
-        for attr_name, attr_value in vars(obj).items():
-            if self._should_skip_attribute(attr_name):
-                continue
-
-            clean_attr_name = attr_name.removeprefix("_")
-
+        for clean_attr_name, attr_value in _iter_entity_attrs(obj):
             # Вложенная сущность (FK)
             if isinstance(attr_value, BaseEntity):
                 entity_snapshot[clean_attr_name] = str(attr_value.id)
@@ -630,17 +669,18 @@ class AuditLogCollector:
             elif isinstance(attr_value, (list, tuple, set)):
                 # Проверяем, содержит ли коллекция BaseEntity
                 if attr_value:
-                    first_item = next(iter(attr_value), None)
-                    if isinstance(first_item, BaseEntity):
+                    if _is_entity_collection(obj.__class__, clean_attr_name, attr_value):
                         entity_snapshot[clean_attr_name] = [str(item.id) for item in attr_value]
                         nested_entities.extend([item for item in attr_value if isinstance(item, BaseEntity)])
                     else:
-                        entity_snapshot[clean_attr_name] = AuditLogValueSerializer.serialize(list(attr_value))
+                        entity_snapshot[clean_attr_name] = _serialize(list(attr_value))
                 else:
-                    entity_snapshot[clean_attr_name] = AuditLogValueSerializer.serialize(list(attr_value))
-            # Обычное поле
+                    entity_snapshot[clean_attr_name] = _serialize(list(attr_value))
+            # Обычное поле (скалярные значения - без вызова сериализатора)
+            elif type(attr_value) in _PASSTHROUGH_TYPES:
+                entity_snapshot[clean_attr_name] = attr_value
             else:
-                entity_snapshot[clean_attr_name] = AuditLogValueSerializer.serialize(attr_value)
+                entity_snapshot[clean_attr_name] = _serialize(attr_value)
 
         # Добавляем запись о текущей сущности
         self._add_entity_record(
@@ -651,34 +691,43 @@ class AuditLogCollector:
             changes=entity_snapshot,
         )
 
-        # Рекурсивно обрабатываем вложенные сущности
-        for nested_entity in nested_entities:
-            self._collect_entity_snapshot_hierarchical(
-                obj=nested_entity,
-                action_type=action_type,
-                entities_changes=entities_changes,
-                processed_ids=processed_ids,
-            )
+        return nested_entities
 
     def _get_m2m_changes_summary(
         self,
         old_value: Any,
         new_value: list[Any] | tuple[Any] | set[Any],
+        owner: type,
+        field_name: str,
     ) -> M2MChangeDict | FieldChangeDict | None:
         """Возвращает краткую информацию об изменениях в M2M коллекции.
 
         Args:
             old_value: старое значение
             new_value: новое значение
+            owner: класс сущности, которой принадлежит поле
+            field_name: имя поля
 
         Returns:
             Словарь с added/removed или old/new, либо None если изменений нет
         """
+        # Быстрая проверка без построения множеств: та же коллекция или поэлементно равные списки
+        # (BaseEntity сравниваются по id) - изменений нет
+        if old_value is new_value:
+            return None
+        if (
+            isinstance(new_value, (list, tuple))
+            and type(old_value) is type(new_value)
+            and len(old_value) == len(new_value)
+            and old_value == new_value
+        ):
+            return None
+
         old_items = set(old_value) if isinstance(old_value, (list, tuple, set)) else set()
         new_items = set(new_value)
 
         # Если элементы - BaseEntity
-        if new_items and isinstance(next(iter(new_items), None), BaseEntity):
+        if new_items and _is_entity_collection(owner, field_name, new_items):
             old_ids = {item.id for item in old_items if isinstance(item, BaseEntity)}
             new_ids = {item.id for item in new_items if isinstance(item, BaseEntity)}
 
@@ -695,8 +744,8 @@ class AuditLogCollector:
             # Для простых типов
             if old_items != new_items:
                 field_change: FieldChangeDict = {
-                    "old": AuditLogValueSerializer.serialize(list(old_items)),
-                    "new": AuditLogValueSerializer.serialize(list(new_items)),
+                    "old": _serialize(list(old_items)),
+                    "new": _serialize(list(new_items)),
                 }
                 return field_change
 
@@ -1,35 +1,169 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import inspect
+import sys
+import types
+import typing
+from collections.abc import Callable, Iterable
 from enum import Enum
-from functools import cached_property
+from operator import attrgetter, itemgetter
 from typing import Any, Generic, Self, TypeAlias, TypeVar
 
 from pydantic import BaseModel
 from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy.orm.attributes import InstrumentedAttribute
 
 from generic.database.repositories.types import TOrmModel
 from generic.domain.entity import BaseEntity, TEntity
 
 sentinel = object()
 
+# Виды полей в плане маппинга сущности в орм модель
+_SCALAR = 0  # обычное поле
+_FK = 1  # внешний ключ (OrmFKMapping)
+_CHECKED = 2  # поле, которое может содержать Enum (заменяется на .value) или сущность (ошибка маппинга)
+
 TBaseMapper = TypeVar("TBaseMapper", bound="BaseMapper[Any, Any]")
 EntityFieldName: TypeAlias = str  # noqa: UP040
 OrmFieldName: TypeAlias = str  # noqa: UP040
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class OrmFKMapping(Generic[TBaseMapper]):
     """Поле в орм модели, которое является внешним ключом."""
 
     name: OrmFieldName  # название колонки в sa-модели (user_id)
     mapper: TBaseMapper | None
+    relation_name: str = dataclasses.field(init=False)  # название атрибута связи для колонки (user)
+
+    def __post_init__(self) -> None:
+        """Вычисляет название атрибута связи один раз."""
+        object.__setattr__(self, "relation_name", sys.intern(self.name.removesuffix("_id")))
+
+
+@functools.cache
+def _entity_init_fields(cls: type) -> frozenset[str]:
+    """Возвращает поля, которые нужно инициализировать для сущности (вычисляется один раз на класс)."""
+    if dataclasses.is_dataclass(cls):
+        fields = (f.name for f in dataclasses.fields(cls) if f.init)
+    elif issubclass(cls, BaseModel):
+        fields = iter(cls.model_fields)
+    else:
+        fields = (name for name in inspect.signature(cls.__init__).parameters if name != "self")
+    return frozenset(map(sys.intern, fields))
+
+
+def _init_type_hints(cls: type) -> dict[str, Any]:
+    """Возвращает аннотации параметров `__init__` класса или пустой словарь, если их не удалось вычислить."""
+    try:
+        return typing.get_type_hints(cls.__init__)
+    except Exception:  # noqa: BLE001
+        return {}
+
+
+# Типы значений, которые требуют проверки при маппинге поля сущности в орм модель
+_CHECKED_VALUE_TYPES = (Enum, BaseEntity, BaseModel)
+
+
+def _may_hold(hint: Any, classes: tuple[type, ...]) -> bool:
+    """Проверяет, может ли значение с аннотацией `hint` быть экземпляром одного из `classes`.
+
+    Для неизвестных и нераспознанных аннотаций возвращает True (проверка остается в рантайме).
+    """
+    if hint is Any or isinstance(hint, TypeVar):
+        return True
+    if supertype := getattr(hint, "__supertype__", None):  # NewType
+        return _may_hold(supertype, classes)
+    if isinstance(hint, typing.TypeAliasType):  # type X = ...
+        return _may_hold(hint.__value__, classes)
+    origin = typing.get_origin(hint)
+    if origin is typing.Union or origin is types.UnionType:
+        return any(_may_hold(arg, classes) for arg in typing.get_args(hint))
+    if origin is typing.Literal:
+        return any(isinstance(arg, classes) for arg in typing.get_args(hint))
+    if origin is not None:  # list[...], dict[...] и т.п.
+        return False
+    if isinstance(hint, type):
+        return issubclass(hint, classes) or hint is object
+    return True
+
+
+def _tuple_attrgetter(names: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    """Возвращает attrgetter, который всегда возвращает кортеж значений (в т.ч. для одного поля)."""
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    if not names:
+        return lambda _obj: ()
+    return attrgetter(*names)
+
+
+def _stored_in_instance_dict(cls: type, names: tuple[str, ...]) -> bool:
+    """Проверяет, что атрибуты `names` хранятся только в `__dict__` экземпляров класса.
+
+    Атрибуты не должны быть объявлены в классе (слоты, property, значения по умолчанию).
+    """
+    return bool(cls.__dictoffset__) and all(inspect.getattr_static(cls, name, sentinel) is sentinel for name in names)
+
+
+def _tuple_instance_dict_getter(names: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    """Возвращает функцию, которая читает атрибуты `names` из `__dict__` объекта одним вызовом itemgetter."""
+    if not names:
+        return lambda _obj: ()
+    if len(names) == 1:
+        getter = itemgetter(names[0])
+        return lambda obj: (getter(obj.__dict__),)
+    getter = itemgetter(*names)
+    return lambda obj: getter(obj.__dict__)  # type:ignore[no-any-return]
+
+
+def _get_attrs(obj: Any, getter: Callable[[Any], tuple[Any, ...]], names: tuple[str, ...]) -> tuple[Any, ...]:
+    """Возвращает значения атрибутов `names` объекта одним вызовом `getter`.
+
+    Если какого-то атрибута нет, значения читаются по одному, а отсутствующие заменяются на `sentinel`.
+    """
+    try:
+        return getter(obj)
+    except (AttributeError, KeyError):
+        return tuple(getattr(obj, name, sentinel) for name in names)
+
+
+def _construct_pydantic_unsafe(cls: type[BaseModel], /, **kwargs: Any) -> BaseModel:
+    """Создает pydantic-модель из `kwargs` без валидации и без заполнения значений по умолчанию."""
+    obj = cls.__new__(cls)
+    object.__setattr__(obj, "__dict__", kwargs)
+    object.__setattr__(obj, "__pydantic_fields_set__", set(kwargs))
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", None)
+    return obj
+
+
+def _get_entity_factory(entity_cls: type, *, unsafe_fast_construct: bool) -> Callable[..., Any]:
+    """Возвращает функцию создания сущности из параметров орм модели.
+
+    Данные из орм модели уже проверены, поэтому pydantic-сущности создаются без валидации.
+    """
+    if not issubclass(entity_cls, BaseModel):
+        return entity_cls
+    if unsafe_fast_construct and not entity_cls.__private_attributes__:
+        return functools.partial(_construct_pydantic_unsafe, entity_cls)
+    return entity_cls.model_construct
+
+
+def _raise_fk_mapping_error(obj: Any, entity_attr: str, value: Any) -> None:
+    msg = (
+        f"""Для FK полей необходимо определить маппинг OrmFKMapping
+        в extra_orm_by_entity_fields: {obj.__class__.__name__}.{entity_attr}={value}""",
+    )
+    raise TypeError(msg)
+
 
-    @property
-    def relation_name(self) -> str:
-        """Название атрибута связи для колонки."""
-        return self.name.removesuffix("_id")
+def _compile_function(name: str, lines: list[str], namespace: dict[str, Any]) -> Callable[..., Any]:
+    """Компилирует функцию `name` из строк исходного кода."""
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return namespace[name]  # type:ignore[no-any-return]
 
 
 OrmByEntityFields: TypeAlias = dict[EntityFieldName, OrmFieldName | OrmFKMapping[TBaseMapper] | None]  # noqa: UP040
@@ -38,12 +172,32 @@ OrmByEntityFields: TypeAlias = dict[EntityFieldName, OrmFieldName | OrmFKMapping
 class BaseMapper(Generic[TEntity, TOrmModel]):
     """Базовый класс маппера сущности в орм модель и обратно."""
 
+    __slots__ = (
+        "entity_cls",
+        "orm_model",
+        "extra_orm_by_entity_fields",
+        "init_entity_fields",
+        "orm_by_entity_fields",
+        "mappers_by_relations",
+        "_entity_factory",
+        "_to_orm_plan",
+        "_to_entity_plan",
+        "_entity_attr_names",
+        "_entity_attrs_getter",
+        "_orm_attr_names",
+        "_orm_attrs_getter",
+        "_to_orm_kwargs",
+        "_to_orm_kwargs_complete",
+        "_to_entity_kwargs",
+    )
+
     def __init__(
         self,
         *,
         entity_cls: type[TEntity],
         orm_model: type[TOrmModel],
         extra_orm_by_entity_fields: OrmByEntityFields | None = None,  # type:ignore[type-arg]
+        unsafe_fast_construct: bool = False,
     ) -> None:
         """Инициализация маппера.
 
@@ -54,6 +208,10 @@ class BaseMapper(Generic[TEntity, TOrmModel]):
                 по атрибутам полей сущности (ключи).
                 Необходимо, если название полей различаются, а также ОБЯЗАТЕЛЕН для FK полей.
                 В качестве значения для вложенных сущностей нужно указать OrmFKMapping.
+            unsafe_fast_construct: создавать pydantic-сущности в orm_to_entity без `model_construct`:
+                параметры становятся `__dict__` объекта как есть, значения по умолчанию не заполняются.
+                Допустимо, только если орм модель заполняет все поля сущности.
+                Не применяется к моделям с приватными атрибутами.
 
         Пример:
             class MyCat:  # сущность
@@ -90,88 +248,270 @@ class BaseMapper(Generic[TEntity, TOrmModel]):
         """
         self.entity_cls = entity_cls
         self.orm_model = orm_model
-        self.extra_orm_by_entity_fields = extra_orm_by_entity_fields or {}
+        # Имена полей интернируются: ключи словарей в горячих циклах сравниваются по ссылке
+        self.extra_orm_by_entity_fields = {
+            sys.intern(entity_attr): sys.intern(orm_attr) if isinstance(orm_attr, str) else orm_attr
+            for entity_attr, orm_attr in (extra_orm_by_entity_fields or {}).items()
+        }
+        # Поля, которые нужно инициализировать для сущности
+        self.init_entity_fields = _entity_init_fields(entity_cls)
+        # Словарь значений полей орм-модели по ключам полей сущности
+        self.orm_by_entity_fields: OrmByEntityFields = {  # type:ignore[type-arg]
+            f: self.extra_orm_by_entity_fields.get(f, f) for f in self.init_entity_fields
+        }
+        # Словарь, где ключ связь с вложенной orm моделью, значение - маппер для нее
+        self.mappers_by_relations: dict[Any, Self] = self._build_mappers_by_relations()
+        self._entity_factory = _get_entity_factory(entity_cls, unsafe_fast_construct=unsafe_fast_construct)
+        # Планы маппинга строятся один раз: в горячих циклах нет разбора orm_by_entity_fields
+        self._to_orm_plan = self._build_to_orm_plan()
+        self._to_entity_plan = self._build_to_entity_plan()
+        # Значения всех полей плана читаются одним вызовом attrgetter (реализован на C)
+        self._entity_attr_names = tuple(item[0] for item in self._to_orm_plan)
+        # Если поля сущности - обычные атрибуты экземпляра, они читаются прямо из __dict__ (без дескрипторов).
+        # Атрибуты орм модели всегда читаются через getattr: у SQLAlchemy это инструментированные дескрипторы
+        self._entity_attrs_getter = (
+            _tuple_instance_dict_getter(self._entity_attr_names)
+            if _stored_in_instance_dict(entity_cls, self._entity_attr_names)
+            else _tuple_attrgetter(self._entity_attr_names)
+        )
+        self._orm_attr_names = tuple(item[1] for item in self._to_entity_plan)
+        self._orm_attrs_getter = _tuple_attrgetter(self._orm_attr_names)
+        # Планы разворачиваются в функции без цикла и ветвлений по виду поля
+        self._to_orm_kwargs = self._compile_to_orm_kwargs()
+        self._to_orm_kwargs_complete = self._compile_to_orm_kwargs_complete()
+        self._to_entity_kwargs = self._compile_to_entity_kwargs()
+
+    def _build_to_orm_plan(self) -> tuple[tuple[str, str, int, str], ...]:
+        """Возвращает план маппинга сущности в орм модель.
+
+        Элементы: (поле сущности, поле орм модели, вид поля, поле сущности с id для FK).
+        Поля, которых нет в орм модели, в план не попадают.
+        """
+        hints = _init_type_hints(self.entity_cls)
+        plan = []
+        for entity_attr, orm_attr in self.orm_by_entity_fields.items():
+            if orm_attr is None:
+                continue
+            if isinstance(orm_attr, OrmFKMapping):
+                plan.append((entity_attr, sys.intern(orm_attr.name), _FK, sys.intern(f"{entity_attr}_id")))
+            elif hasattr(self.orm_model, orm_attr):
+                # Без аннотации поле может содержать что угодно, в т.ч. Enum и сущности
+                kind = _CHECKED if _may_hold(hints.get(entity_attr, Any), _CHECKED_VALUE_TYPES) else _SCALAR
+                plan.append((entity_attr, orm_attr, kind, ""))
+        return tuple(plan)
+
+    def _build_to_entity_plan(self) -> tuple[tuple[str, str, BaseMapper[Any, Any] | None, bool], ...]:
+        """Возвращает план маппинга орм модели в сущность.
+
+        Элементы: (поле сущности, атрибут орм модели, маппер FK-сущности, является ли поле FK).
+        """
+        plan = []
+        for entity_attr, orm_attr in self.orm_by_entity_fields.items():
+            if orm_attr is None:
+                continue
+            if isinstance(orm_attr, OrmFKMapping):
+                plan.append((entity_attr, orm_attr.relation_name, orm_attr.mapper, True))
+            else:
+                plan.append((entity_attr, orm_attr, None, False))
+        return tuple(plan)
+
+    def _compile_to_orm_kwargs(self) -> Callable[[Any, tuple[Any, ...]], dict[str, Any]]:
+        """Генерирует функцию `(сущность, значения полей плана) -> параметры орм модели` по плану маппинга.
+
+        Для плана (("id", "id", _SCALAR, ""), ("cat", "cat_id", _FK, "cat_id")) получится:
+            def to_orm_kwargs(obj, values):
+                init_kwargs = {}
+                v0, v1, = values
+                if v0 is not sentinel:
+                    init_kwargs['id'] = v0
+                if v1 is not sentinel:
+                    value_id = getattr(obj, 'cat_id', sentinel)
+                    init_kwargs['cat_id'] = getattr(v1, "id", None) if value_id is sentinel else value_id
+                return init_kwargs
+        """
+        lines = ["def to_orm_kwargs(obj, values):", "    init_kwargs = {}"]
+        if self._to_orm_plan:
+            lines.append(f"    {''.join(f'v{i}, ' for i in range(len(self._to_orm_plan)))}= values")
+        for i, (entity_attr, orm_attr, kind, fk_id_attr) in enumerate(self._to_orm_plan):
+            value = f"v{i}"
+            lines.append(f"    if {value} is not sentinel:")
+            if kind == _SCALAR:
+                lines.append(f"        init_kwargs[{orm_attr!r}] = {value}")
+            elif kind == _CHECKED:
+                lines += [
+                    f"        if isinstance({value}, entity_types):",
+                    f"            raise_fk_mapping_error(obj, {entity_attr!r}, {value})",
+                    f"        init_kwargs[{orm_attr!r}] = {value}.value if isinstance({value}, Enum) else {value}",
+                ]
+            else:
+                # Берется entity.fk_id, если такое поле есть у сущности, иначе entity.fk.id
+                lines += [
+                    f"        value_id = getattr(obj, {fk_id_attr!r}, sentinel)",
+                    f'        init_kwargs[{orm_attr!r}] = getattr({value}, "id", None) if value_id is sentinel else value_id',
+                ]
+        lines.append("    return init_kwargs")
+        namespace = {
+            "sentinel": sentinel,
+            "Enum": Enum,
+            "entity_types": (BaseEntity, BaseModel),
+            "raise_fk_mapping_error": _raise_fk_mapping_error,
+        }
+        return _compile_function("to_orm_kwargs", lines, namespace)
+
+    def _compile_to_orm_kwargs_complete(self) -> Callable[[Any, tuple[Any, ...]], dict[str, Any]]:
+        """Генерирует аналог `_compile_to_orm_kwargs` для случая, когда у сущности есть все поля плана.
+
+        Проверки на sentinel не нужны, поэтому словарь создается одним выражением с известными ключами.
+        Для плана (("id", "id", _SCALAR, ""), ("cat", "cat_id", _FK, "cat_id")) получится:
+            def to_orm_kwargs_complete(obj, values):
+                v0, v1, = values
+                value_id = getattr(obj, 'cat_id', sentinel)
+                v1 = getattr(v1, "id", None) if value_id is sentinel else value_id
+                return {'id': v0, 'cat_id': v1}
+        """
+        lines = ["def to_orm_kwargs_complete(obj, values):"]
+        if self._to_orm_plan:
+            lines.append(f"    {''.join(f'v{i}, ' for i in range(len(self._to_orm_plan)))}= values")
+        for i, (entity_attr, _orm_attr, kind, fk_id_attr) in enumerate(self._to_orm_plan):
+            value = f"v{i}"
+            if kind == _CHECKED:
+                lines += [
+                    f"    if isinstance({value}, entity_types):",
+                    f"        raise_fk_mapping_error(obj, {entity_attr!r}, {value})",
+                    f"    if isinstance({value}, Enum):",
+                    f"        {value} = {value}.value",
+                ]
+            elif kind == _FK:
+                lines += [
+                    f"    value_id = getattr(obj, {fk_id_attr!r}, sentinel)",
+                    f'    {value} = getattr({value}, "id", None) if value_id is sentinel else value_id',
+                ]
+        items = ", ".join(f"{orm_attr!r}: v{i}" for i, (_, orm_attr, _, _) in enumerate(self._to_orm_plan))
+        lines.append(f"    return {{{items}}}")
+        namespace = {
+            "sentinel": sentinel,
+            "Enum": Enum,
+            "entity_types": (BaseEntity, BaseModel),
+            "raise_fk_mapping_error": _raise_fk_mapping_error,
+        }
+        return _compile_function("to_orm_kwargs_complete", lines, namespace)
+
+    def _compile_to_entity_kwargs(self) -> Callable[[tuple[Any, ...], dict[str, Any]], dict[str, Any]]:
+        """Генерирует функцию `(значения атрибутов плана, kwargs) -> параметры сущности` по плану маппинга.
+
+        Для плана (("id", "id", None, False), ("cat", "cat", cat_mapper, True)) получится:
+            def to_entity_kwargs(values, kwargs):
+                init_kwargs = {}
+                v0, v1, = values
+                if v0 is not sentinel:
+                    init_kwargs['id'] = v0
+                if v1 is not sentinel:
+                    init_kwargs['cat'] = None if v1 is None else mapper1.orm_to_entity(v1, **kwargs)
+                return init_kwargs
+        """
+        lines = ["def to_entity_kwargs(values, kwargs):", "    init_kwargs = {}"]
+        if self._to_entity_plan:
+            lines.append(f"    {''.join(f'v{i}, ' for i in range(len(self._to_entity_plan)))}= values")
+        namespace: dict[str, Any] = {"sentinel": sentinel}
+        for i, (entity_attr, _get_attr, mapper, is_fk) in enumerate(self._to_entity_plan):
+            value = f"v{i}"
+            if not is_fk:
+                lines += [f"    if {value} is not sentinel:", f"        init_kwargs[{entity_attr!r}] = {value}"]
+            elif mapper:
+                namespace[f"mapper{i}"] = mapper
+                lines += [
+                    f"    if {value} is not sentinel:",
+                    f"        init_kwargs[{entity_attr!r}] = "
+                    f"None if {value} is None else mapper{i}.orm_to_entity({value}, **kwargs)",
+                ]
+            else:
+                # FK без маппера заполняется, только если связи нет
+                lines += [f"    if {value} is None:", f"        init_kwargs[{entity_attr!r}] = None"]
+        lines.append("    return init_kwargs")
+        return _compile_function("to_entity_kwargs", lines, namespace)
 
     def entity_to_orm(self, obj: TEntity, **kwargs: Any) -> TOrmModel:
         """Конвертирует TEntity -> TSaModel.
 
-        Для FK сущностей будет замаплено только поле orm.fk_id (entity.fk.id or entity.fk_id).
+        Для FK сущностей будет замаплено только поле orm.fk_id (entity.fk_id, а если его нет - entity.fk.id).
         FK объектом считается ключ, у которого в качестве значения OrmFKMapping.
         """
         init_kwargs = self._get_init_orm_kwargs(obj, **kwargs)
         return self.orm_model(**init_kwargs)
 
-    def orm_to_entity(self, orm: TOrmModel, **kwargs: Any) -> TEntity:
-        """Конвертирует TOrmModel -> TEntity."""
-        init_kwargs = self._get_init_entity_kwargs(orm, **kwargs)
-        return self.entity_cls(**init_kwargs)
+    def orm_to_entity(self, orm: TOrmModel, *, validate: bool = False, **kwargs: Any) -> TEntity:
+        """Конвертирует TOrmModel -> TEntity.
 
-    def _get_init_orm_kwargs(self, obj: TEntity, **kwargs: Any) -> dict[str, Any]:  # noqa: ARG002
-        """Возвращает параметры инициализации орм-модели."""
-        init_kwargs: dict[str, Any] = {}
-        for entity_attr, orm_attr in self.orm_by_entity_fields.items():
-            if orm_attr is None:
-                continue
-            value = getattr(obj, entity_attr, sentinel)
-            if value is sentinel:
+        Pydantic-сущности создаются через `model_construct` (без валидации),
+        `validate=True` включает валидацию (в т.ч. для вложенных FK сущностей).
+        """
+        init_kwargs = self._get_init_entity_kwargs(orm, validate=validate, **kwargs)
+        if validate:
+            return self.entity_cls(**init_kwargs)
+        return self._entity_factory(**init_kwargs)  # type:ignore[no-any-return]
+
+    def bulk_orm_to_entity(self, orms: Iterable[TOrmModel], *, validate: bool = False, **kwargs: Any) -> list[TEntity]:
+        """Конвертирует набор TOrmModel -> список TEntity.
+
+        План маппинга обходится по полям, а не по строкам: значения FK поля всех строк
+        конвертируются вложенным маппером одним вызовом `bulk_orm_to_entity`.
+        Если `orm_to_entity` переопределен в наследнике, строки конвертируются им по одной.
+        """
+        orms = list(orms)
+        if type(self).orm_to_entity is not BaseMapper.orm_to_entity:
+            return [self.orm_to_entity(orm, validate=validate, **kwargs) for orm in orms]
+
+        _sentinel = sentinel
+        rows_values = [_get_attrs(orm, self._orm_attrs_getter, self._orm_attr_names) for orm in orms]
+        rows_items: list[list[tuple[str, Any]]] = [[] for _ in rows_values]
+        for column, (entity_attr, _get_attr, mapper, is_fk) in enumerate(self._to_entity_plan):
+            if not is_fk or mapper is None:
+                for items, values in zip(rows_items, rows_values, strict=True):
+                    orm_value = values[column]
+                    if orm_value is not _sentinel and (orm_value is None or not is_fk):
+                        items.append((entity_attr, orm_value))
                 continue
-            if isinstance(value, (BaseEntity, BaseModel)) and not isinstance(orm_attr, OrmFKMapping):
-                msg = (
-                    f"""Для FK полей необходимо определить маппинг OrmFKMapping
-                    в extra_orm_by_entity_fields: {obj.__class__.__name__}.{entity_attr}={value}""",
-                )
-                raise TypeError(msg)
-            if isinstance(value, Enum):
-                value = value.value
-
-            if isinstance(orm_attr, str):
-                if not hasattr(self.orm_model, orm_attr):
+
+            # FK поле: строки с вложенными орм моделями конвертируются вложенным маппером разом
+            fk_rows_items: list[list[tuple[str, Any]]] = []
+            fk_orm_values: list[Any] = []
+            for items, values in zip(rows_items, rows_values, strict=True):
+                orm_value = values[column]
+                if orm_value is _sentinel:
                     continue
-                init_kwargs[orm_attr] = value
+                if orm_value is None:
+                    items.append((entity_attr, None))
+                else:
+                    fk_rows_items.append(items)
+                    fk_orm_values.append(orm_value)
+            if fk_orm_values:
+                fk_entities = mapper.bulk_orm_to_entity(fk_orm_values, validate=validate, **kwargs)
+                for items, fk_entity in zip(fk_rows_items, fk_entities, strict=True):
+                    items.append((entity_attr, fk_entity))
+
+        factory = self.entity_cls if validate else self._entity_factory
+        return [factory(**dict(items)) for items in rows_items]
 
-            elif isinstance(orm_attr, OrmFKMapping):
-                orm_attr = orm_attr.name  # noqa: PLW2901
-                value_id = getattr(obj, f"{entity_attr}_id", sentinel)
-                value_id = getattr(value, "id", None) if sentinel else value_id
-                init_kwargs[orm_attr] = value_id
-        return init_kwargs
+    def _get_init_orm_kwargs(self, obj: TEntity, **kwargs: Any) -> dict[str, Any]:  # noqa: ARG002
+        """Возвращает параметры инициализации орм-модели."""
+        try:
+            values = self._entity_attrs_getter(obj)
+        except (AttributeError, KeyError):
+            # Каких-то полей у сущности нет: они заменяются на sentinel и пропускаются
+            values = tuple(getattr(obj, name, sentinel) for name in self._entity_attr_names)
+            return self._to_orm_kwargs(obj, values)  # type:ignore[no-any-return]
+        return self._to_orm_kwargs_complete(obj, values)  # type:ignore[no-any-return]
 
     def _get_init_entity_kwargs(self, orm: TOrmModel, **kwargs: Any) -> dict[str, Any]:
         """Возвращает параметры инициализации сущности."""
-        init_kwargs: dict[str, Any] = {}
-        for entity_attr, orm_attr in self.orm_by_entity_fields.items():
-            if orm_attr is None:
-                continue
-            get_attr = orm_attr.name.removesuffix("_id") if isinstance(orm_attr, OrmFKMapping) else orm_attr
-            orm_value = getattr(orm, get_attr, sentinel)
-            if orm_value is sentinel:
-                continue
+        orm_values = _get_attrs(orm, self._orm_attrs_getter, self._orm_attr_names)
+        return self._to_entity_kwargs(orm_values, kwargs)  # type:ignore[no-any-return]
 
-            if orm_value is None:
-                init_kwargs[entity_attr] = None
-            elif isinstance(orm_attr, str):
-                init_kwargs[entity_attr] = orm_value
-            elif isinstance(orm_attr, OrmFKMapping) and orm_attr.mapper:
-                init_kwargs[entity_attr] = orm_attr.mapper.orm_to_entity(orm_value, **kwargs)
-        return init_kwargs
-
-    @cached_property
-    def orm_by_entity_fields(self) -> OrmByEntityFields:  # type:ignore[type-arg]
-        """Возвращает словарь значений полей орм-модели по ключам полей сущности."""
-        return {f: self.extra_orm_by_entity_fields.get(f, f) for f in self.init_entity_fields}
-
-    @cached_property
-    def init_entity_fields(self) -> set[str]:
-        """Возвращает поля, которые нужно инициализировать для сущности."""
-        init_sign = inspect.signature(self.entity_cls.__init__)
-        return set(init_sign.parameters.keys()) - {"self"}
-
-    @cached_property
-    def mappers_by_relations(self) -> dict[Any, Self]:
+    def _build_mappers_by_relations(self) -> dict[Any, Self]:
         """Возвращает словарь, где ключ связь с вложенной orm моделью, значение - маппер для нее."""
         return {
             getattr(self.orm_model, orm_attr.relation_name): orm_attr.mapper  # type:ignore[misc,union-attr]
             for orm_attr in self.orm_by_entity_fields.values()
             if (isinstance(orm_attr, OrmFKMapping) and orm_attr.mapper is not None)
-            or (hasattr(orm_attr, "property") and isinstance(orm_attr.property, RelationshipProperty))  # type:ignore[union-attr]
+            or (isinstance(orm_attr, InstrumentedAttribute) and isinstance(orm_attr.property, RelationshipProperty))
         }
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import abc
-import copy
 import uuid
 from collections.abc import Callable, Sequence
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Self, TypeAlias, TypeVar
+from typing import Any, ClassVar, Self, TypeAlias, TypeVar
 
 import sqlalchemy as sa
 from sqlalchemy import BinaryExpression, Column, and_, not_, or_
@@ -16,6 +15,7 @@ from sqlalchemy.sql.elements import BooleanClauseList, ClauseElement
 from sqlalchemy.sql.selectable import Select
 
 from generic.database.utils.sa_utils.join import idempotent_join
+from generic.domain.entity import entity_attr_names
 
 TSaModel = TypeVar("TSaModel", bound=DeclarativeBase)
 
@@ -41,6 +41,40 @@ TSaModel = TypeVar("TSaModel", bound=DeclarativeBase)
 TEntityId = uuid.UUID | str
 _Number: TypeAlias = int | float | Decimal  # noqa: UP040
 
+# Методы поиска. Хранятся как int: сравнение и поиск в словаре без вызова `Enum.__eq__`/`Enum.__hash__`
+_EQ = 0
+_NEQ = 1
+_IEQ = 2
+_ILIKE = 3
+_LIKE = 4
+_GT = 5
+_GTE = 6
+_LT = 7
+_LTE = 8
+_ISNULL = 9
+
+_METHOD_NAMES = {
+    _EQ: "eq",
+    _NEQ: "neq",
+    _IEQ: "ieq",
+    _ILIKE: "ilike",
+    _LIKE: "like",
+    _GT: "gt",
+    _GTE: "gte",
+    _LT: "lt",
+    _LTE: "lte",
+    _ISNULL: "isnull",
+}
+
+
+def _ensure_lower_column(crit: StrCriteria | RelationCriteria) -> None:
+    """Создает выражение `lower(column)` один раз на фабрику критериев; копии получают его при копировании.
+
+    Выражения SQLAlchemy неизменяемы, поэтому одно выражение можно использовать в разных запросах.
+    """
+    if crit._lower_column is None:  # noqa: SLF001
+        crit._lower_column = sa.func.lower(crit._column)  # noqa: SLF001
+
 
 class BaseCriteria(abc.ABC):
     """Абстрактный класс для инкапсуляции фильтрации записей, отдаваемых репозиторием.
@@ -52,7 +86,10 @@ class BaseCriteria(abc.ABC):
        -- со значениями, допустимыми классами вроде Enum, определенных в слое Domain.
     """
 
-    _is_negate = False
+    __slots__ = ("_is_negate",)
+
+    def __init__(self) -> None:
+        self._is_negate = False
 
     @abc.abstractmethod
     def get_conditions(self) -> list[BooleanClauseList | ClauseElement]:
@@ -64,6 +101,9 @@ class BaseCriteria(abc.ABC):
         Учитывает neq
         """
         conditions = self.get_conditions()
+        if len(conditions) == 1:
+            # and_ из одного условия возвращает само условие, обертка не нужна
+            return [not_(conditions[0])] if self._is_negate else conditions
         if self._is_negate:
             return [not_(and_(*conditions))]
         return [and_(*conditions)]
@@ -79,8 +119,20 @@ class BaseCriteria(abc.ABC):
 
         Копия нужна для CombinedCriteria при реализации критерия через __call__
         для того, чтобы не перезатирались значения.
+        Слоты и `__dict__` (у наследников без `__slots__`) копируются напрямую, без `copy.copy`.
         """
-        return copy.copy(self)
+        cls = self.__class__
+        new = object.__new__(cls)
+        for name in entity_attr_names(cls):
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                # незаполненный слот остается незаполненным и в копии
+                continue
+            setattr(new, name, value)
+        if (state := getattr(self, "__dict__", None)) is not None:
+            new.__dict__.update(state)
+        return new
 
     def _get_join_query(self, query: Select) -> Select:
         """Запрос на join."""
@@ -98,7 +150,13 @@ class BaseCombinedCriteria(BaseCriteria, abc.ABC):
     переданных как входные параметры.
     """
 
+    __slots__ = ("_criteria",)
+
+    # Оператор объединения условий (and_/or_), задается в наследнике атрибутом класса
+    _operator: ClassVar[Callable[..., Any]]
+
     def __init__(self, criteria: Sequence[BaseCriteria]) -> None:
+        super().__init__()
         self._criteria = criteria
 
     def __repr__(self) -> str:
@@ -106,25 +164,23 @@ class BaseCombinedCriteria(BaseCriteria, abc.ABC):
 
     def get_conditions(self) -> list[BooleanClauseList | ClauseElement]:
         """Метод должен возвращать список условий, которые будут применены к запросу."""
-        conditions = []
+        if len(self._criteria) == 1:
+            # and_/or_ из одного условия возвращает само условие
+            return self._criteria[0].get_result_conditions()
+        conditions: list[BooleanClauseList | ClauseElement] = []
+        extend = conditions.extend
         for crit in self._criteria:
-            conditions += crit.get_result_conditions()
-        op = self._operator
-        return [op(*conditions)]
+            extend(crit.get_result_conditions())
+        return [self._operator(*conditions)]
 
     def filter(self, query: Select) -> Select:
         """Метод можно переопределять, если стандартного поведения недостаточно."""
-        conditions = []
+        conditions: list[BooleanClauseList | ClauseElement] = []
+        extend = conditions.extend
         for crit in self._criteria:
-            conditions += crit.get_result_conditions()
+            extend(crit.get_result_conditions())
             query = crit._get_join_query(query)  # noqa: SLF001
-        op = self._operator
-        return query.where(op(*conditions))
-
-    @property
-    @abc.abstractmethod
-    def _operator(self) -> Callable[[Any], Any]:
-        raise NotImplementedError
+        return query.where(self._operator(*conditions))
 
     def _get_join_query(self, query: Select) -> Select:
         """Запрос на join."""
@@ -143,9 +199,9 @@ class AndCombinedCriteria(BaseCombinedCriteria):
     combined_crit = AndCombinedCriteria(criteria=[proj_crit, done_status_crit])
     """
 
-    @property
-    def _operator(self) -> Any:
-        return and_
+    __slots__ = ()
+
+    _operator = staticmethod(and_)
 
 
 class OrCombinedCriteria(BaseCombinedCriteria):
@@ -158,17 +214,23 @@ class OrCombinedCriteria(BaseCombinedCriteria):
     combined_crit = OrCombinedCriteria(criteria=[proj_crit, done_status_crit])
     """
 
-    @property
-    def _operator(self) -> Any:
-        return or_
+    __slots__ = ()
+
+    _operator = staticmethod(or_)
 
 
 class SimpleSearchCriteria(BaseCriteria):
     """Параметризированный критерий для простого поиска"""
 
+    __slots__ = ("_model", "_search_columns", "_value", "search_fields")
+
     def __init__(self, search_fields: list[str], model: type[TSaModel]) -> None:
+        super().__init__()
         self.search_fields = search_fields
         self._model = model
+        # Колонки модели разрешаются один раз, а не на каждый вызов get_conditions
+        self._search_columns: tuple[InstrumentedAttribute, ...] = tuple(getattr(model, f) for f in search_fields)
+        self._value: str = None  # type:ignore[assignment]
 
     def __call__(self, value: str) -> Self:
         """Вызов."""
@@ -184,22 +246,26 @@ class SimpleSearchCriteria(BaseCriteria):
 
     def get_conditions(self) -> list[BooleanClauseList | ClauseElement]:
         """Условия поиска"""
-        conditions = [getattr(self._model, field).ilike(f"%{self._value}%") for field in self.search_fields]
-        return [or_(*conditions)]
+        pattern = f"%{self._value}%"
+        return [or_(*[column.ilike(pattern) for column in self._search_columns])]
 
 
 class EntityByIdsCriteria(BaseCriteria):
     """Критерий сущности по id/ids."""
 
-    class Method(Enum):
+    class Method:
         """Методы поиска."""
 
-        eq = "eq"
-        neq = "neq"
+        eq = _EQ
+        neq = _NEQ
+
+    __slots__ = ("_method", "_method_call", "_model", "_value")
 
     def __init__(self, model: type[TSaModel]) -> None:
+        super().__init__()
         self._model = model
-        self._method_call: EntityByIdsCriteria.Method | None = None
+        self._method_call: int | None = None
+        self._method: Callable[[Any, Any], BinaryExpression] = None  # type:ignore[assignment]
         self._value: TEntityId | list[TEntityId] | None = None
 
     def __repr__(self) -> str:
@@ -209,26 +275,21 @@ class EntityByIdsCriteria(BaseCriteria):
 
     def __call__(self, value: TEntityId | list[TEntityId]) -> Self:
         """Поиск по точному совпадению."""
-        self._method_call = self.Method.eq
+        self._method_call = _EQ
+        self._method = _in if isinstance(value, list) else _equals
         self._value = value
         return self._get_copy()
 
     def neq(self, value: TEntityId | list[TEntityId]) -> Self:
         """Поиск по точному НЕсовпадению."""
-        self._method_call = self.Method.neq
+        self._method_call = _NEQ
+        self._method = _not_in if isinstance(value, list) else _not_equals
         self._value = value
         return self._get_copy()
 
     def get_conditions(self) -> list[BooleanClauseList | ClauseElement]:
         """Условие критерия."""
-        if self._method_call == self.Method.neq:
-            if isinstance(self._value, list):
-                return [self._model.id.notin_(self._value)]
-            return [self._model.id != self._value]
-
-        if isinstance(self._value, list):
-            return [self._model.id.in_(self._value)]
-        return [self._model.id == self._value]
+        return [self._method(self._model.id, self._value)]
 
 
 class FKCriteria(BaseCriteria):
@@ -241,47 +302,46 @@ class FKCriteria(BaseCriteria):
         criteria = cr_col.by_organization_ids(user_id)
     """
 
-    class Method(Enum):
+    class Method:
         """Методы поиска."""
 
-        eq = "eq"
-        neq = "neq"
+        eq = _EQ
+        neq = _NEQ
+
+    __slots__ = ("_fk_column", "_method", "_method_call", "_value")
 
     def __init__(self, fk_column: Column) -> None:
         """Инициализация фабрики критериев для FK связей."""
+        super().__init__()
         self._fk_column = fk_column
-        self._method_call: FKCriteria.Method = None  # type:ignore[assignment]
+        self._method_call: int = None  # type:ignore[assignment]
+        self._method: Callable[[Any, Any], BinaryExpression] = None  # type:ignore[assignment]
         self._value: TEntityId | list[TEntityId] = None  # type:ignore[assignment]
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}"
-            f'(column="{self._fk_column}", method_call="{self._method_call.value}", '
+            f'(column="{self._fk_column}", method_call="{_METHOD_NAMES.get(self._method_call)}", '
             f'value="{self._value}", is_negate="{self._is_negate}")'
         )
 
     def __call__(self, value: TEntityId | list[TEntityId]) -> Self:
         """Поиск по точному совпадению."""
-        self._method_call = self.Method.eq
+        self._method_call = _EQ
+        self._method = _in if isinstance(value, list) else _equals
         self._value = value
         return self._get_copy()
 
     def neq(self, value: TEntityId | list[TEntityId]) -> Self:
         """Поиск по точному НЕсовпадению."""
-        self._method_call = self.Method.neq
+        self._method_call = _NEQ
+        self._method = _not_in if isinstance(value, list) else _not_equals
         self._value = value
         return self._get_copy()
 
     def get_conditions(self) -> list[BooleanClauseList | ClauseElement]:
         """Условие критерия."""
-        if self._method_call == self.Method.neq:
-            if isinstance(self._value, list):
-                return [self._fk_column.notin_(self._value)]
-            return [self._fk_column != self._value]
-
-        if isinstance(self._value, list):
-            return [self._fk_column.in_(self._value)]
-        return [self._fk_column == self._value]
+        return [self._method(self._fk_column, self._value)]
 
 
 class M2MCriteria(BaseCriteria):
@@ -301,6 +361,8 @@ class M2MCriteria(BaseCriteria):
         criteria = cr_col.by_user_id(user_id)
     """
 
+    __slots__ = ("_m2m_search_column", "_m2m_target_column", "_target_model", "_value")
+
     def __init__(
         self,
         target_model: type[TSaModel],
@@ -308,6 +370,7 @@ class M2MCriteria(BaseCriteria):
         m2m_search_column: Column,
     ) -> None:
         """Инициализация фабрики критериев для M2M связей."""
+        super().__init__()
         self._target_model = target_model
         self._m2m_target_column = m2m_target_column
         self._m2m_search_column = m2m_search_column
@@ -349,6 +412,32 @@ class M2MCriteria(BaseCriteria):
         return query.outerjoin(self._m2m_target_column.class_)
 
 
+def _str_equals(crit: StrCriteria) -> ClauseElement:
+    value = crit._value  # noqa: SLF001
+    if isinstance(value, list):
+        return crit._column.in_(value)  # noqa: SLF001
+    if isinstance(value, Enum):
+        value = str(value)
+    return crit._column == value  # noqa: SLF001
+
+
+def _str_not_equals(crit: StrCriteria) -> ClauseElement:
+    return crit._column != crit._value  # noqa: SLF001
+
+
+# Для ieq/ilike/like значение для сравнения (`_prepared_value`) готовится один раз в методе-сеттере
+def _ieq(crit: StrCriteria | RelationCriteria) -> ClauseElement:
+    return crit._lower_column == crit._prepared_value  # noqa: SLF001
+
+
+def _ilike(crit: StrCriteria | RelationCriteria) -> ClauseElement:
+    return crit._lower_column.ilike(crit._prepared_value)  # noqa: SLF001
+
+
+def _like(crit: StrCriteria | RelationCriteria) -> ClauseElement:
+    return crit._column.like(crit._prepared_value)  # type:ignore[union-attr]  # noqa: SLF001
+
+
 class StrCriteria(BaseCriteria):
     """Фабрика критериев для str/Enum полей.
 
@@ -359,77 +448,80 @@ class StrCriteria(BaseCriteria):
         criteria = cr_col.by_name("Иван")
     """
 
-    _method_call: StrCriteria.Method
-    _value: str | list[str]
+    __slots__ = ("_column", "_lower_column", "_method_call", "_prepared_value", "_value")
 
-    class Method(Enum):
+    class Method:
         """Методы поиска."""
 
-        eq = "eq"
-        ieq = "ieq"
-        neq = "neq"
-        ilike = "ilike"
-        like = "like"
+        eq = _EQ
+        ieq = _IEQ
+        neq = _NEQ
+        ilike = _ILIKE
+        like = _LIKE
+
+    # Построители условия по методу поиска
+    _CONDITIONS: ClassVar[dict[int, Callable[[StrCriteria], ClauseElement]]] = {
+        _EQ: _str_equals,
+        _IEQ: _ieq,
+        _NEQ: _str_not_equals,
+        _ILIKE: _ilike,
+        _LIKE: _like,
+    }
 
     def __init__(self, column: Column) -> None:
         """Инициализация фабрики критериев."""
+        super().__init__()
         self._column = column
-        # self._method_call: StrCriteria.Method = None  # type:ignore[assignment]
-        # self._value: str | list[str] | Enum = None  # type:ignore[assignment]
+        self._lower_column: ClauseElement | None = None
+        self._method_call: int = None  # type:ignore[assignment]
+        self._value: str | list[str] | Enum = None  # type:ignore[assignment]
+        self._prepared_value: str | None = None
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}"
-            f'(column="{self._column}", method_call={self._method_call}, '
+            f'(column="{self._column}", method_call="{_METHOD_NAMES.get(self._method_call)}", '
             f'value="{self._value}", is_negate="{self._is_negate}")'
         )
 
     def __call__(self, value: str | list[str]) -> Self:
         """Поиск по точному совпадению с учетом регистра."""
-        self._method_call = self.Method.eq
+        self._method_call = _EQ
         self._value = value
         return self._get_copy()
 
     def ieq(self, value: str) -> Self:
         """Поиск по точному совпадению без учета регистра."""
-        self._method_call = self.Method.ieq
+        self._method_call = _IEQ
+        _ensure_lower_column(self)
         self._value = value
+        self._prepared_value = value.lower()
         return self._get_copy()
 
     def neq(self, value: str) -> Self:
         """Поиск по точному НЕсовпадению с учетом регистра."""
-        self._method_call = self.Method.neq
+        self._method_call = _NEQ
         self._value = value
         return self._get_copy()
 
     def ilike(self, value: str) -> Self:
         """Поиск по частичному совпадению без учета регистра."""
-        self._method_call = self.Method.ilike
+        self._method_call = _ILIKE
+        _ensure_lower_column(self)
         self._value = value
+        self._prepared_value = f"%{value.lower()}%"
         return self._get_copy()
 
     def like(self, value: str) -> Self:
         """Поиск по частичному совпадению с учетом регистра."""
-        self._method_call = self.Method.like
+        self._method_call = _LIKE
         self._value = value
+        self._prepared_value = f"%{value}%"
         return self._get_copy()
 
     def get_conditions(self) -> list[BooleanClauseList | ClauseElement]:
         """Условие критерия."""
-        if self._method_call == self.Method.ieq:
-            return [sa.func.lower(self._column) == self._value.lower()]  # type:ignore[union-attr]
-        if self._method_call == self.Method.neq:
-            return [self._column != self._value]
-        if self._method_call == self.Method.ilike:
-            return [sa.func.lower(self._column).ilike(f"%{self._value.lower()}%")]  # type:ignore[union-attr]
-        if self._method_call == self.Method.like:
-            return [self._column.like(f"%{self._value}%")]
-
-        if isinstance(self._value, list):
-            return [self._column.in_(self._value)]
-        if isinstance(self._value, Enum):
-            self._value = str(self._value)
-        return [self._column == self._value]
+        return [self._CONDITIONS[self._method_call](self)]
 
 
 class BoolCriteria(BaseCriteria):
@@ -442,8 +534,11 @@ class BoolCriteria(BaseCriteria):
         criteria = cr_col.by_active(True)
     """
 
+    __slots__ = ("_column", "_value")
+
     def __init__(self, column: Column) -> None:
         """Инициализация фабрики критериев."""
+        super().__init__()
         self._column = column
         self._value: bool = None  # type:ignore[assignment]
 
@@ -486,11 +581,31 @@ def _lt(field: Column, value: Any) -> BinaryExpression:
     return field < value
 
 
+def _in(field: Column, value: Any) -> BinaryExpression:
+    return field.in_(value)
+
+
+def _not_in(field: Column, value: Any) -> BinaryExpression:
+    return field.notin_(value)
+
+
+def _relation_compare(crit: RelationCriteria) -> ClauseElement:
+    value = crit._value  # noqa: SLF001
+    if isinstance(value, list):
+        return crit._column.in_(value)  # type:ignore[union-attr]  # noqa: SLF001
+    if isinstance(value, Enum):
+        value = value.value
+    return crit._method(crit._column, value)  # noqa: SLF001
+
+
 class DatetimeCriteria(BaseCriteria):
     """Фабрика критериев для datetime полей."""
 
+    __slots__ = ("_column", "_method", "_value")
+
     def __init__(self, column: Column) -> None:
         """Инициализация фабрики критериев."""
+        super().__init__()
         self._column = column
         self._method: Any | None = None
         self._value: datetime | None = None
@@ -541,14 +656,14 @@ class DatetimeCriteria(BaseCriteria):
 class NumberCriteria(BaseCriteria):
     """Фабрика критериев для числовых полей."""
 
-    _method: Any
-    _value: Any
+    __slots__ = ("_column", "_method", "_value")
 
     def __init__(self, column: Column) -> None:
         """Инициализация фабрики критериев."""
+        super().__init__()
         self._column = column
-        # self. | None = None
-        # self. | None = None
+        self._method: Any = None
+        self._value: Any = None
 
     def __repr__(self) -> str:
         return (
@@ -614,21 +729,47 @@ class RelationCriteria(BaseCriteria):
         criteria = cc.by_users_name("Иван")
     """
 
-    _method: BinaryExpression
-    _method_call: RelationCriteria.Method
-
-    class Method(Enum):
+    __slots__ = (
+        "_column",
+        "_first_fk_column",
+        "_fk_columns",
+        "_fk_not_null_conditions",
+        "_lower_column",
+        "_method",
+        "_method_call",
+        "_model",
+        "_models_to_join",
+        "_negate_subquery",
+        "_prepared_value",
+        "_value",
+        "_with_non_related",
+    )
+
+    class Method:
         """Методы поиска."""
 
-        eq = "eq"
-        ieq = "ieq"
-        ilike = "ilike"
-        like = "like"
-        gt = "gt"
-        gte = "gte"
-        lt = "lt"
-        lte = "lte"
-        isnull = "isnull"
+        eq = _EQ
+        ieq = _IEQ
+        ilike = _ILIKE
+        like = _LIKE
+        gt = _GT
+        gte = _GTE
+        lt = _LT
+        lte = _LTE
+        isnull = _ISNULL
+
+    # Построители условия по методу поиска; сравнения выполняет `_method`
+    _CONDITIONS: ClassVar[dict[int, Callable[[RelationCriteria], ClauseElement]]] = {
+        _EQ: _relation_compare,
+        _IEQ: _ieq,
+        _ILIKE: _ilike,
+        _LIKE: _like,
+        _GT: _relation_compare,
+        _GTE: _relation_compare,
+        _LT: _relation_compare,
+        _LTE: _relation_compare,
+        _ISNULL: _relation_compare,
+    }
 
     def __init__(self, model: type[TSaModel], field_path: str) -> None:
         """Инициализация фабрики критериев.
@@ -637,6 +778,7 @@ class RelationCriteria(BaseCriteria):
             model: искомая модель.
             field_path: Путь через точку к полю, по которому будет фильтрация.
         """
+        super().__init__()
         column = None
         self._fk_columns: list[Column] = []
         self._models_to_join = []
@@ -665,74 +807,89 @@ class RelationCriteria(BaseCriteria):
 
         self._model = model
         self._column = column
-        # self. | None = None
-        # self. = None
+        self._lower_column: ClauseElement | None = None
+        self._method: Callable[[Any, Any], BinaryExpression] = None  # type:ignore[assignment]
+        self._method_call: int = None  # type:ignore[assignment]
         self._value: TEntityId | str | Enum | _Number | None | list[TEntityId | str | _Number] = None
+        self._prepared_value: str | None = None
         self._with_non_related: bool = False
 
+        # Части условия для neq не зависят от значения, поэтому строятся один раз
+        self._fk_not_null_conditions = tuple(c.expression.right.is_not(None) for c in self._fk_columns)
+        self._negate_subquery: Select | None = None
+        if self._fk_columns and self._first_fk_column.prop.direction is ONETOMANY:
+            self._negate_subquery = sa.select(self._first_fk_column.expression.right)
+            for _model in self._models_to_join[1:]:
+                self._negate_subquery = idempotent_join(self._negate_subquery, _model)
+
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}"
-            f'(column="{self._column}", method_call="{self._method_call.value}", '
+            f'(column="{self._column}", method_call="{_METHOD_NAMES.get(self._method_call)}", '
             f'value="{self._value}", is_negate="{self._is_negate}")'
         )
 
     def __call__(self, value: TEntityId | str | Enum | _Number | list[TEntityId | str | _Number]) -> Self:
         """Вызов."""
-        self._method_call = self.Method.eq
+        self._method_call = _EQ
         self._method = _equals
         self._value = value
         return self._get_copy()
 
     def ieq(self, value: str) -> Self:
         """Поиск по точному совпадению без учета регистра."""
-        self._method_call = self.Method.ieq
+        self._method_call = _IEQ
+        _ensure_lower_column(self)
         self._value = value
+        self._prepared_value = value.lower()
         return self._get_copy()
 
     def ilike(self, value: str) -> Self:
         """Поиск по частичному совпадению без учета регистра."""
-        self._method_call = self.Method.ilike
+        self._method_call = _ILIKE
+        _ensure_lower_column(self)
         self._value = value
+        self._prepared_value = f"%{value.lower()}%"
         return self._get_copy()
 
     def like(self, value: str) -> Self:
         """Поиск по частичному совпадению с учетом регистра."""
-        self._method_call = self.Method.like
+        self._method_call = _LIKE
         self._value = value
+        self._prepared_value = f"%{value}%"
         return self._get_copy()
 
     def gte(self, value: _Number) -> Self:
         """Больше или равно."""
-        self._method_call = self.Method.gte
+        self._method_call = _GTE
         self._method = _gte
         self._value = value
         return self._get_copy()
 
     def gt(self, value: _Number) -> Self:
         """Больше."""
-        self._method_call = self.Method.gt
+        self._method_call = _GT
         self._method = _gt
         self._value = value
         return self._get_copy()
 
     def lte(self, value: _Number) -> Self:
         """Меньше или равно."""
-        self._method_call = self.Method.lte
+        self._method_call = _LTE
         self._method = _lte
         self._value = value
         return self._get_copy()
 
     def lt(self, value: _Number) -> Self:
         """Меньше."""
-        self._method_call = self.Method.lt
+        self._method_call = _LT
         self._method = _lt
         self._value = value
         return self._get_copy()
 
     def isnull(self, value: bool = True) -> Self:
         """Возвращает критерий для проверки null."""
-        self._method_call = self.Method.isnull
+        self._method_call = _ISNULL
         self._method = _equals if value else _not_equals
         self._value = None
         return self._get_copy()
@@ -744,40 +901,27 @@ class RelationCriteria(BaseCriteria):
 
     def _get_join_query(self, query: Select) -> Select:
         """Запрос на join."""
-        if self._is_negate and self._first_fk_column.prop.direction is ONETOMANY:
-            # джоиниться будет _subquery в get_conditions
+        if self._is_negate and self._negate_subquery is not None:
+            # джоиниться будет _negate_subquery в get_conditions
             return query
 
+        isouter = self._with_non_related
         for model in self._models_to_join:
-            query = idempotent_join(query, model, isouter=self._with_non_related)
+            query = idempotent_join(query, model, isouter=isouter)
         return query
 
     def get_conditions(self) -> list[BooleanClauseList | ClauseElement]:
         """Условие критерия."""
         conditions = self._prepare_conditions()
         if self._is_negate:
-            conditions = [c.expression.right.is_not(None) for c in self._fk_columns] + conditions
-
-            if self._first_fk_column.prop.direction is ONETOMANY:
-                _subquery = sa.select(self._first_fk_column.expression.right).where(*conditions)
-                for model in self._models_to_join[1:]:
-                    _subquery = idempotent_join(_subquery, model)
+            conditions = [*self._fk_not_null_conditions, *conditions]
 
-                return [self._model.id.in_(_subquery)]
+            if self._negate_subquery is not None:
+                # where() возвращает новый запрос, заготовка не изменяется
+                return [self._model.id.in_(self._negate_subquery.where(*conditions))]
 
         return conditions
 
     def _prepare_conditions(self) -> list[BooleanClauseList | ClauseElement]:
         """Условие критерия."""
-        if self._method_call == self.Method.ieq:
-            return [sa.func.lower(self._column) == self._value.lower()]  # type:ignore[union-attr]
-        if self._method_call == self.Method.ilike:
-            return [sa.func.lower(self._column).ilike(f"%{self._value.lower()}%")]  # type:ignore[union-attr]
-        if self._method_call == self.Method.like:
-            return [self._column.like(f"%{self._value}%")]  # type:ignore[union-attr]
-
-        if isinstance(self._value, list):
-            return [self._column.in_(self._value)]  # type:ignore[union-attr]
-        if isinstance(self._value, Enum):
-            self._value = self._value.value
-        return [self._method(self._column, self._value)]
+        return [self._CONDITIONS[self._method_call](self)]
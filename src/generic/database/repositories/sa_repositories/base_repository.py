@@ -24,7 +24,7 @@ from generic.database.repositories.sa_repositories.exceptions import MultipleObj
 from generic.database.softdelete.queries import deleted_select, not_deleted_select
 from generic.domain.bounded_events.context import bounded_events_collector_ctx
 from generic.domain.bounded_events.events import EntityChangedDataEvent
-from generic.domain.entity import BaseEntity, TEntity
+from generic.domain.entity import BaseEntity, TEntity, entity_vars
 from generic.domain.exceptions import NotFoundError
 from generic.domain.mixins.archived import ArchivedMixin
 from generic.domain.mixins.soft_delete import SoftDeleteMixin
@@ -147,7 +147,7 @@ class SaRepository(Generic[TEntity, TSaModel, TBaseMapper]):
         nested_entities: list[tuple[TEntity, str]] = []
 
         # Обходим все атрибуты сущности
-        for attr_value in vars(obj).values():
+        for attr_value in entity_vars(obj).values():
             # Обрабатываем только коллекции (НЕ единичные FK)
             if isinstance(attr_value, (list, tuple, set)):
                 for item in attr_value:
@@ -243,7 +243,9 @@ class SaRepository(Generic[TEntity, TSaModel, TBaseMapper]):
                 if not exists_map.get(entity_key, False):
                     # Сущность не существует - это создание
                     # Добавляем данные о созданной сущности в changes основного события
-                    created_data = self._audit_log_collector.collect_create_data(nested_entity)
+                    created_data = self._audit_log_collector.collect_create_data(
+                        nested_entity, created_at=updated_data["created_at"]
+                    )
                     # Объединяем данные: берем все поля кроме root_entity и created_at
                     for key, value in created_data.items():
                         if key not in ("root_entity", "created_at"):
@@ -259,9 +261,10 @@ class SaRepository(Generic[TEntity, TSaModel, TBaseMapper]):
         """Добавляет сущности в хранилище."""
         self._check_allowed_for_read_only_repository()
         sa_objs = []
+        created_at = self._audit_log_collector.now_str()  # одно время записи audit log на весь пакет
         for entity in entities:
             sa_obj = self.mapper.entity_to_orm(entity, **kwargs)
-            created_data = self._get_data_for_audit_log_when_create(entity)
+            created_data = self._get_data_for_audit_log_when_create(entity, created_at=created_at)
             event_collector = bounded_events_collector_ctx.get()
             event = EntityChangedDataEvent(
                 entity_id=entity.id,
@@ -322,16 +325,17 @@ class SaRepository(Generic[TEntity, TSaModel, TBaseMapper]):
         """
         return self._audit_log_collector.collect_delete_data(obj)
 
-    def _get_data_for_audit_log_when_create(self, obj: TEntity) -> dict[str, Any]:
+    def _get_data_for_audit_log_when_create(self, obj: TEntity, created_at: str | None = None) -> dict[str, Any]:
         """Возвращает данные о сущности для audit log при создании.
 
         Args:
             obj: созданная сущность
+            created_at: время записи audit log; если не передано - текущее время
 
         Returns:
             Словарь с данными сущности
         """
-        return self._audit_log_collector.collect_create_data(obj)
+        return self._audit_log_collector.collect_create_data(obj, created_at=created_at)
 
     async def get_by_id(
         self,
@@ -447,7 +451,7 @@ class SaRepository(Generic[TEntity, TSaModel, TBaseMapper]):
         )
 
         result = await self._session.execute(query)
-        return [self.mapper.orm_to_entity(row, **kwargs) for row in result.unique().scalars().all()]
+        return self.mapper.bulk_orm_to_entity(result.unique().scalars().all(), **kwargs)
 
     async def all(
         self,
@@ -1,4 +1,5 @@
-from typing import TypeVar
+import functools
+from typing import Any, TypeVar
 from uuid import UUID, uuid4
 
 from generic.domain.mixins.log_changed_attrs import LogChangedAttrsMixin
@@ -7,7 +8,13 @@ TEntity = TypeVar("TEntity", bound="BaseEntity")
 
 
 class BaseEntity(LogChangedAttrsMixin):
-    """Базовый класс для сущности."""
+    """Базовый класс для сущности.
+
+    Сущности объявляют `__slots__` (без `__dict__`), поэтому для обхода атрибутов
+    экземпляра вместо `vars(obj)` используется `entity_vars(obj)`.
+    """
+
+    __slots__ = ("_id",)
 
     entity_type: str = NotImplemented  # Латиницей, в нижнем регистре, в единственном числе
 
@@ -39,3 +46,39 @@ class BaseEntity(LogChangedAttrsMixin):
         if not isinstance(other, self.__class__):
             return False
         return self.id == other.id
+
+
+@functools.cache
+def entity_attr_names(cls: type) -> tuple[str, ...]:
+    """Возвращает названия слотов класса и всех его предков (от базовых к наследникам).
+
+    `__dict__` и `__weakref__` пропускаются, приватные имена возвращаются в искаженном виде (`_Cls__name`).
+    """
+    names: list[str] = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for slot in slots:
+            if slot in ("__dict__", "__weakref__"):
+                continue
+            if slot.startswith("__") and not slot.endswith("__"):
+                # приватные имена слотов хранятся в классе в искаженном виде
+                slot = f"_{klass.__name__.lstrip('_')}{slot}"  # noqa: PLW2901
+            names.append(slot)
+    return tuple(names)
+
+
+_missing = object()
+
+
+def entity_vars(obj: object) -> dict[str, Any]:
+    """Аналог `vars(obj)` с учетом `__slots__`: возвращает установленные атрибуты экземпляра."""
+    attrs = {}
+    for name in entity_attr_names(type(obj)):
+        value = getattr(obj, name, _missing)
+        if value is not _missing:
+            attrs[name] = value
+    if instance_dict := getattr(obj, "__dict__", None):
+        attrs.update(instance_dict)
+    return attrs
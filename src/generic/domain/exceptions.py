@@ -1,11 +1,11 @@
 import abc
 from dataclasses import dataclass
-from typing import Any, Self
+from http import HTTPStatus
+from typing import Any, ClassVar, Self
 from uuid import UUID
 
-from humps import camelize
-
 from generic.domain.values import UNEVALUATED
+from generic.utils.case_utils import camelize
 from generic.utils.log_levels import LogLevel
 
 
@@ -27,6 +27,8 @@ class FieldErrorDetail:
 class DomainError(Exception):
     """Исключение бизнес логики."""
 
+    http_status: ClassVar[int] = HTTPStatus.BAD_REQUEST  # HTTP-код ответа при возникновении исключения в API
+
     def __init__(
         self,
         message: str,
@@ -117,6 +119,8 @@ class NotFoundError(abc.ABC, DomainError):
         raise IssueNotFoundError(id=self._issue_id)
     """
 
+    http_status: ClassVar[int] = HTTPStatus.NOT_FOUND
+
     def __init__(
         self,
         id: Any,
@@ -141,6 +145,8 @@ class NotFoundError(abc.ABC, DomainError):
 class PermissionAccessError(DomainError):
     """Ошибка, связанная с разрешениями."""
 
+    http_status: ClassVar[int] = HTTPStatus.FORBIDDEN
+
     def __init__(self, message: str = "Нет доступа", **kwargs: Any) -> None:
         super().__init__(message, **kwargs)
 
@@ -5,7 +5,12 @@ from generic.utils.time_utils import now
 
 
 class ArchivedMixin:
-    """Миксин для сущностей с полями для пометки архивности."""
+    """Миксин для сущностей с полями для пометки архивности.
+
+    Слоты `_is_archived`, `_archived_at` объявляет конечный класс сущности.
+    """
+
+    __slots__ = ()
 
     def __init__(
         self,
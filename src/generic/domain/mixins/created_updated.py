@@ -5,7 +5,12 @@ from generic.utils.time_utils import now
 
 
 class CreatedUpdatedMixin:
-    """Миксин для сущностей с полями created_at и updated_at."""
+    """Миксин для сущностей с полями created_at и updated_at.
+
+    Слоты под поля объявляет конечный класс сущности (несколько непустых `__slots__` в базах несовместимы).
+    """
+
+    __slots__ = ()
 
     def __init__(
         self,
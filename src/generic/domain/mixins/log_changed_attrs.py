@@ -16,6 +16,8 @@ class LogChangedAttrs:
 class LogChangedAttrsMixin:
     """Миксин для отслеживания изменений атрибутов класса."""
 
+    __slots__ = ("_logs_changed_attrs_by_field",)
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._logs_changed_attrs_by_field: dict[str, LogChangedAttrs] = {}
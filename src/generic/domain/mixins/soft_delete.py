@@ -5,7 +5,12 @@ from generic.utils.time_utils import now
 
 
 class SoftDeleteMixin:
-    """Миксин для сущностей с полями для пометки на удаление."""
+    """Миксин для сущностей с полями для пометки на удаление.
+
+    Слоты `_is_deleted`, `_deleted_at` объявляет конечный класс сущности.
+    """
+
+    __slots__ = ()
 
     def __init__(
         self,
@@ -77,6 +77,15 @@ class BaseUnitOfWork:
         """Откатывает изменения в БД."""
         await self._session.rollback()  # type:ignore[union-attr]
 
+    def release(self) -> None:
+        """Очищает состояние последней транзакции перед повторным использованием UoW.
+
+        Обработчик событий ссылается на UoW и хранит события, поэтому не должен переживать запрос.
+        """
+        self._bounded_events_processor = None
+        if self._repositories_attrs is not None:
+            self._exit_repositories()
+
     @property
     def session(self) -> AsyncSession | None:
         """Возвращает сессию."""
@@ -0,0 +1,42 @@
+import functools
+
+
+@functools.lru_cache(maxsize=4096)
+def camelize(value: str) -> str:
+    """snake_case -> camelCase за один проход по частям строки (результат как у `humps.camelize`).
+
+    Ведущие и замыкающие подчеркивания сохраняются: `_private_field` -> `_privateField`, `from_` -> `from_`.
+    Первая буква становится строчной, если строка не начинается с аббревиатуры: `Item2Name` -> `item2Name`.
+    """
+    if value.isupper() or value.isnumeric():
+        return value
+    if value and not value[:2].isupper():
+        value = value[0].lower() + value[1:]
+    stripped = value.strip("_")
+    if not stripped:
+        return value
+    leading = len(value) - len(value.lstrip("_"))
+    head, *tail = stripped.split("_")
+    return (
+        value[:leading]
+        + head
+        + "".join(part[:1].upper() + part[1:] for part in tail)
+        + value[leading + len(stripped) :]
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def decamelize(value: str) -> str:
+    """CamelCase/camelCase -> snake_case за один проход по символам.
+
+    Аббревиатуры не разбиваются по буквам: `HTTPResponse` -> `http_response`.
+    """
+    chars: list[str] = []
+    last = len(value) - 1
+    for i, char in enumerate(value):
+        if char.isupper() and i and value[i - 1] != "_":
+            prev = value[i - 1]
+            if prev.islower() or prev.isdigit() or (prev.isupper() and i < last and value[i + 1].islower()):
+                chars.append("_")
+        chars.append(char.lower())
+    return "".join(chars)
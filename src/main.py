@@ -7,4 +7,5 @@ if __name__ == "__main__":
         factory=True,
         reload=True,
         reload_dirs=["src"],
+        loop="uvloop",  # Цикл событий на libuv вместо стандартного asyncio
     )
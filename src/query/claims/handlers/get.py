@@ -1,41 +1,85 @@
+import dataclasses
 import datetime as dt
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
 from adapters.outbound.database.models.claims.claims import SaClaim
+from adapters.outbound.database.models.claims.payment_items import SaPaymentItem
 from core.claims.domain.aggregates.claim.entities.payment_item.types import PaymentItemId
 from core.claims.domain.aggregates.claim.exceptions import ClaimNotFoundError
 from core.claims.domain.aggregates.claim.types import ClaimId
-from generic.api.pydantic_models import CamelCasedAliasesModel
 
 
-class _PaymentItem(CamelCasedAliasesModel):
+# DTO запроса - только данные из БД. Схема ответа (и ее сериализация) задается в слое API
+# и собирается из DTO так же, как из агрегата `Заявка`
+@dataclasses.dataclass(slots=True, frozen=True)
+class PaymentItemDTO:
     id: PaymentItemId
     created_at: dt.datetime | None
     updated_at: dt.datetime | None
 
 
-class ClaimDetailDTO(CamelCasedAliasesModel):
+@dataclasses.dataclass(slots=True, frozen=True)
+class ClaimDetailDTO:
     id: ClaimId
     system_number: str
     created_at: dt.datetime | None
     updated_at: dt.datetime | None
     is_deleted: bool
     deleted_at: dt.datetime | None
-    payment_items: list[_PaymentItem]
+    payment_items: list[PaymentItemDTO]
 
 
 class Handler:
     """Данные об 1 `Заявке`."""
 
+    __slots__ = ("session",)
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
     async def execute(self, claim_id: ClaimId) -> ClaimDetailDTO:
-        stmt = select(SaClaim).where(SaClaim.id == claim_id).options(joinedload(SaClaim.payment_items))
+        # Один запрос колонок (без ORM-объектов и identity map): строка заявки соединяется
+        # с ее предметами оплаты, DTO собирается за один проход по строкам результата.
+        # Колонки предметов оплаты покрываются индексом по claim_id
+        stmt = (
+            select(
+                SaClaim.id,
+                SaClaim.system_number,
+                SaClaim.created_at,
+                SaClaim.updated_at,
+                SaClaim.is_deleted,
+                SaClaim.deleted_at,
+                SaPaymentItem.id.label("payment_item_id"),
+                SaPaymentItem.created_at.label("payment_item_created_at"),
+                SaPaymentItem.updated_at.label("payment_item_updated_at"),
+            )
+            .outerjoin(SaPaymentItem, SaPaymentItem.claim_id == SaClaim.id)
+            .where(SaClaim.id == claim_id)
+            # Порядок предметов оплаты фиксирован: от него зависит тело ответа и ETag
+            .order_by(SaPaymentItem.created_at, SaPaymentItem.id)
+        )
         cursor = await self.session.execute(stmt)
-        orm = cursor.unique().scalar_one_or_none()
-        if not orm:
+        rows = cursor.all()
+        if not rows:
             raise ClaimNotFoundError(id=claim_id)
-        return ClaimDetailDTO.model_validate(orm)
+
+        claim = rows[0]
+        return ClaimDetailDTO(
+            id=claim.id,
+            system_number=claim.system_number,
+            created_at=claim.created_at,
+            updated_at=claim.updated_at,
+            is_deleted=claim.is_deleted,
+            deleted_at=claim.deleted_at,
+            payment_items=[
+                PaymentItemDTO(
+                    id=row.payment_item_id,
+                    created_at=row.payment_item_created_at,
+                    updated_at=row.payment_item_updated_at,
+                )
+                for row in rows
+                if row.payment_item_id is not None
+            ],
+        )
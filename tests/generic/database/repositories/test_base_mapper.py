@@ -0,0 +1,253 @@
+import enum
+import types
+import uuid
+from typing import Any
+
+import pytest
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+from generic.database.repositories.base_mapper import BaseMapper, OrmFKMapping, sentinel
+from generic.domain.entity import BaseEntity, entity_vars
+
+OWNER_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+OTHER_OWNER_ID = uuid.UUID("00000000-0000-0000-0000-000000000002")
+ITEM_ID = uuid.UUID("00000000-0000-0000-0000-00000000000a")
+
+
+class _SaBase(DeclarativeBase):
+    pass
+
+
+class SaOwner(_SaBase):
+    __tablename__ = "owners"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    name: Mapped[str]
+
+
+class SaItem(_SaBase):
+    __tablename__ = "items"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    name: Mapped[str | None]
+    status: Mapped[str | None]
+    owner_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("owners.id"))
+    owner: Mapped[SaOwner | None] = relationship()
+
+
+class Status(enum.Enum):
+    NEW = "new"
+    DONE = "done"
+
+
+class Owner(BaseEntity):
+    __slots__ = ("name",)
+
+    def __init__(self, id: uuid.UUID, name: str) -> None:
+        self.id = id
+        self.name = name
+        super().__init__()
+
+
+class Item(BaseEntity):
+    __slots__ = ("name", "status", "owner")
+
+    def __init__(
+        self,
+        id: uuid.UUID,
+        name: str | None = None,
+        status: Status | None = None,
+        owner: Owner | None = None,
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.status = status
+        self.owner = owner
+        super().__init__()
+
+
+class ItemWithOwnerId(Item):
+    """Сущность с отдельным полем FK: `owner_id` имеет приоритет над `owner.id`."""
+
+    __slots__ = ("owner_id",)
+
+    def __init__(
+        self,
+        id: uuid.UUID,
+        name: str | None,
+        status: Status | None,
+        owner: Owner | None,
+        owner_id: uuid.UUID | None,
+    ) -> None:
+        self.owner_id = owner_id
+        super().__init__(id=id, name=name, status=status, owner=owner)
+
+
+def _item_without_name() -> Item:
+    item = Item(id=ITEM_ID, name="item", status=Status.NEW, owner=None)
+    del item.name
+    return item
+
+
+owner_mapper = BaseMapper(entity_cls=Owner, orm_model=SaOwner)
+item_mapper = BaseMapper(
+    entity_cls=Item,
+    orm_model=SaItem,
+    extra_orm_by_entity_fields={"owner": OrmFKMapping("owner_id", owner_mapper)},
+)
+item_with_owner_id_mapper = BaseMapper(
+    entity_cls=ItemWithOwnerId,
+    orm_model=SaItem,
+    extra_orm_by_entity_fields={"owner": OrmFKMapping("owner_id", owner_mapper)},
+)
+# FK без маппера: связь заполняется, только если ее нет
+item_without_owner_mapper_mapper = BaseMapper(
+    entity_cls=Item,
+    orm_model=SaItem,
+    extra_orm_by_entity_fields={"owner": OrmFKMapping("owner_id", None)},
+)
+# Маппер без OrmFKMapping: сущность в поле `owner` - ошибка конфигурации
+item_without_fk_mapping_mapper = BaseMapper(entity_cls=Item, orm_model=SaItem)
+
+
+def _to_orm_kwargs_by_path(mapper: BaseMapper[Any, Any], entity: Any) -> dict[str, dict[str, Any]]:
+    """Возвращает параметры орм модели, полученные каждым путем маппинга сущности в орм модель."""
+    values = tuple(getattr(entity, name, sentinel) for name in mapper._entity_attr_names)
+    results = {
+        "to_orm_kwargs": mapper._to_orm_kwargs(entity, values),
+        "get_init_orm_kwargs": mapper._get_init_orm_kwargs(entity),
+    }
+    if all(value is not sentinel for value in values):
+        results["to_orm_kwargs_complete"] = mapper._to_orm_kwargs_complete(entity, values)
+    return results
+
+
+ENTITY_TO_ORM_CASES = [
+    pytest.param(
+        item_mapper,
+        lambda: Item(id=ITEM_ID, name="item", status=Status.NEW, owner=Owner(id=OWNER_ID, name="owner")),
+        {"id": ITEM_ID, "name": "item", "status": "new", "owner_id": OWNER_ID},
+        id="fk_object",
+    ),
+    pytest.param(
+        item_with_owner_id_mapper,
+        lambda: ItemWithOwnerId(
+            id=ITEM_ID,
+            name="item",
+            status=Status.DONE,
+            owner=Owner(id=OTHER_OWNER_ID, name="owner"),
+            owner_id=OWNER_ID,
+        ),
+        {"id": ITEM_ID, "name": "item", "status": "done", "owner_id": OWNER_ID},
+        id="fk_id",
+    ),
+    pytest.param(
+        item_mapper,
+        lambda: Item(id=ITEM_ID, name=None, status=None, owner=None),
+        {"id": ITEM_ID, "name": None, "status": None, "owner_id": None},
+        id="fk_none",
+    ),
+    pytest.param(
+        item_mapper,
+        _item_without_name,
+        {"id": ITEM_ID, "status": "new", "owner_id": None},
+        id="missing_attribute",
+    ),
+]
+
+
+@pytest.mark.parametrize(("mapper", "make_entity", "expected"), ENTITY_TO_ORM_CASES)
+def test_entity_to_orm_paths_agree(
+    mapper: BaseMapper[Any, Any],
+    make_entity: Any,
+    expected: dict[str, Any],
+) -> None:
+    results = _to_orm_kwargs_by_path(mapper, make_entity())
+
+    assert results == dict.fromkeys(results, expected)
+
+
+@pytest.mark.parametrize(("mapper", "make_entity", "expected"), ENTITY_TO_ORM_CASES)
+def test_entity_to_orm(mapper: BaseMapper[Any, Any], make_entity: Any, expected: dict[str, Any]) -> None:
+    orm = mapper.entity_to_orm(make_entity())
+
+    assert isinstance(orm, SaItem)
+    assert {name: getattr(orm, name) for name in expected} == expected
+
+
+def test_missing_attribute_uses_sentinel_path() -> None:
+    results = _to_orm_kwargs_by_path(item_mapper, _item_without_name())
+
+    assert "to_orm_kwargs_complete" not in results
+
+
+def _item_with_owner_without_name() -> Item:
+    item = Item(id=ITEM_ID, name="item", status=None, owner=Owner(id=OWNER_ID, name="owner"))
+    del item.name
+    return item
+
+
+@pytest.mark.parametrize(
+    "make_entity",
+    [
+        pytest.param(
+            lambda: Item(id=ITEM_ID, name="item", status=None, owner=Owner(id=OWNER_ID, name="owner")),
+            id="complete",
+        ),
+        pytest.param(_item_with_owner_without_name, id="missing_attribute"),
+    ],
+)
+def test_entity_in_non_fk_field_raises(make_entity: Any) -> None:
+    mapper = item_without_fk_mapping_mapper
+    entity = make_entity()
+    values = tuple(getattr(entity, name, sentinel) for name in mapper._entity_attr_names)
+    paths = [mapper.entity_to_orm, lambda entity: mapper._to_orm_kwargs(entity, values)]
+    if all(value is not sentinel for value in values):
+        paths.append(lambda entity: mapper._to_orm_kwargs_complete(entity, values))
+
+    for path in paths:
+        with pytest.raises(TypeError):
+            path(entity)
+
+
+def _entity_state(value: Any) -> Any:
+    """Возвращает значение для сравнения: сущности (в т.ч. вложенные) сравниваются по всем атрибутам, а не по id."""
+    if isinstance(value, BaseEntity):
+        return type(value), {name: _entity_state(attr) for name, attr in entity_vars(value).items()}
+    return value
+
+
+def _item_orms() -> list[Any]:
+    owner = SaOwner(id=OWNER_ID, name="owner")
+    return [
+        SaItem(id=uuid.uuid4(), name="first", status="new", owner_id=OWNER_ID, owner=owner),
+        SaItem(id=uuid.uuid4(), name=None, status=None, owner_id=None, owner=None),
+        SaItem(id=uuid.uuid4(), name="same owner", status="done", owner_id=OWNER_ID, owner=owner),
+        SaItem(id=uuid.uuid4(), name="other owner", status="new", owner=SaOwner(id=OTHER_OWNER_ID, name="other")),
+        # Строка без части атрибутов (например, из частичной выборки)
+        types.SimpleNamespace(id=uuid.uuid4(), status="new", owner=None),
+        types.SimpleNamespace(id=uuid.uuid4(), owner=SaOwner(id=OWNER_ID, name="owner")),
+    ]
+
+
+@pytest.mark.parametrize(
+    "mapper",
+    [
+        pytest.param(item_mapper, id="nested_mapper"),
+        pytest.param(item_without_owner_mapper_mapper, id="fk_without_mapper"),
+        pytest.param(owner_mapper, id="without_fk"),
+    ],
+)
+@pytest.mark.parametrize("validate", [False, True])
+def test_bulk_orm_to_entity_matches_orm_to_entity(mapper: BaseMapper[Any, Any], validate: bool) -> None:
+    orms = _item_orms() if mapper.orm_model is SaItem else [SaOwner(id=OWNER_ID, name="owner")]
+
+    bulk_entities = mapper.bulk_orm_to_entity(orms, validate=validate)
+    entities = [mapper.orm_to_entity(orm, validate=validate) for orm in orms]
+
+    assert list(map(_entity_state, bulk_entities)) == list(map(_entity_state, entities))
+
+
+def test_bulk_orm_to_entity_empty() -> None:
+    assert item_mapper.bulk_orm_to_entity([]) == []
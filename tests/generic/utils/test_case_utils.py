@@ -0,0 +1,43 @@
+import pytest
+
+from generic.utils.case_utils import camelize, decamelize
+
+# Ожидаемые значения получены из pyhumps 3.8.0 (humps.camelize / humps.decamelize),
+# который заменили эти функции: алиасы полей API не должны измениться
+CAMELIZE_CASES = [
+    ("system_number", "systemNumber"),
+    ("from_", "from_"),
+    ("type_", "type_"),
+    ("_private_field", "_privateField"),
+    ("__dunder__", "__dunder__"),
+    ("a__b", "aB"),
+    ("a_b__c_", "aBC_"),
+    ("field_1", "field1"),
+    ("HTTPResponse", "HTTPResponse"),
+    ("HTTP_response", "HTTPResponse"),
+    ("Item2Name", "item2Name"),
+    ("ID", "ID"),
+    ("_", "_"),
+    ("", ""),
+]
+
+DECAMELIZE_CASES = [
+    ("systemNumber", "system_number"),
+    ("from_", "from_"),
+    ("_private_field", "_private_field"),
+    ("a__b", "a__b"),
+    ("field_1", "field_1"),
+    ("HTTPResponse", "http_response"),
+    ("Item2Name", "item2_name"),
+    ("PaymentItem", "payment_item"),
+]
+
+
+@pytest.mark.parametrize(("value", "expected"), CAMELIZE_CASES)
+def test_camelize_matches_pyhumps(value: str, expected: str) -> None:
+    assert camelize(value) == expected
+
+
+@pytest.mark.parametrize(("value", "expected"), DECAMELIZE_CASES)
+def test_decamelize_matches_pyhumps(value: str, expected: str) -> None:
+    assert decamelize(value) == expected